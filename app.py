@@ -9,15 +9,24 @@ import sys
 import json
 import datetime
 import urllib.request
-from io import BytesIO, StringIO
+import urllib.error
+import urllib3
+import ssl
+from io import BytesIO
 from docxtpl import DocxTemplate
 from docx import Document
 from docx.shared import Pt, Inches
-from docxcompose.composer import Composer
+from docx.oxml.ns import qn
+from docx.opc import pkgwriter
 import configparser
 import tempfile
 import uuid
 import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import csv
+import socket
+from collections import Counter, OrderedDict
 import werkzeug.utils
 from werkzeug.utils import secure_filename
 import logging
@@ -26,12 +35,36 @@ import webbrowser
 import time
 from src.utils.document_handler import DocumentHandler
 from src.ui.app import InventorySlipGenerator
-from flask_session import Session
-import zlib
 import pandas as pd
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+# Slips are short-lived files opened right away, so every docx save (pages and
+# the merged output) uses the fastest deflate level instead of zlib's default
+DOCX_COMPRESSLEVEL = 1
+_default_phys_pkg_writer = pkgwriter.PhysPkgWriter
+
+def _fast_phys_pkg_writer(pkg_file):
+    writer = _default_phys_pkg_writer(pkg_file)
+    zipf = getattr(writer, '_zipf', None)
+    if zipf is not None:
+        zipf.compresslevel = DOCX_COMPRESSLEVEL
+    return writer
+
+pkgwriter.PhysPkgWriter = _fast_phys_pkg_writer
+
 # Create a dedicated cache directory
 CACHE_DIR = Path(tempfile.gettempdir()) / 'flask_app_cache'
 CACHE_DIR.mkdir(exist_ok=True)
@@ -41,8 +74,67 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj):
+    """Serialize an object to a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+# TLS contexts are built once at import; creating one loads and parses the
+# system CA bundle. The Bamboo and URL loaders have always skipped verification.
+SSL_CONTEXT = ssl.create_default_context()
+UNVERIFIED_SSL_CONTEXT = ssl.create_default_context()
+UNVERIFIED_SSL_CONTEXT.check_hostname = False
+UNVERIFIED_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+# Shared connection pools so repeated fetches reuse keep-alive connections
+HTTP = urllib3.PoolManager(num_pools=8, maxsize=16, ssl_context=SSL_CONTEXT)
+HTTP_UNVERIFIED = urllib3.PoolManager(num_pools=8, maxsize=16, cert_reqs='CERT_NONE',
+                                      ssl_context=UNVERIFIED_SSL_CONTEXT)
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+def fetch_url(url, headers=None, verify=True, timeout=None):
+    """
+    GET a URL through the shared connection pool and return the body bytes.
+    Error statuses raise urllib.error.HTTPError so callers can inspect e.code.
+    """
+    pool = HTTP if verify else HTTP_UNVERIFIED
+    resp = pool.request('GET', url, headers=headers, timeout=timeout)
+    if resp.status >= 400:
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+    return resp.data
+
 # Constants
 CONFIG_FILE = os.path.expanduser("~/inventory_generator_config.ini")
+SECRET_KEY_FILE = os.path.expanduser("~/.inventory_generator_secret_key")
+
+def load_secret_key():
+    """Return the session signing key from SECRET_KEY, or a per-install key file created on first run"""
+    key = os.environ.get('SECRET_KEY')
+    if key:
+        return key
+    try:
+        with open(SECRET_KEY_FILE, 'rb') as f:
+            key = f.read()
+        if len(key) >= 32:
+            return key
+    except OSError:
+        pass
+    key = os.urandom(32)
+    try:
+        fd = os.open(SECRET_KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(key)
+    except OSError as e:
+        # Sessions still work, they just won't survive a restart
+        logger.warning(f"Could not save secret key to {SECRET_KEY_FILE}: {e}")
+    return key
 
 def get_downloads_dir():
     """Get the default Downloads directory for both Windows and Mac"""
@@ -88,67 +180,174 @@ except Exception as e:
         DEFAULT_SAVE_DIR = tempfile.gettempdir()
 
 APP_VERSION = "2.0.0"
-ALLOWED_EXTENSIONS = {'csv', 'json', 'docx'}
+ALLOWED_EXTENSIONS = frozenset({'csv', 'json', 'docx'})
 MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16 MB max upload size
 
+# Template label fields and the DataFrame columns that fill them
+LABEL_COLUMNS = {
+    "ProductName": "Product Name*",
+    "Barcode": "Barcode*",
+    "AcceptedDate": "Accepted Date",
+    "QuantityReceived": "Quantity Received*",
+    "Vendor": "Vendor",
+    "ProductType": "Product Type*"
+}
+EMPTY_LABEL = dict.fromkeys(LABEL_COLUMNS, "")
+
+# Worker threads used to render slip pages concurrently
+RENDER_WORKERS = min(4, os.cpu_count() or 1)
+
 # Initialize Flask application
 app = Flask(__name__,
     static_url_path='',
     static_folder='static',
     template_folder='templates'
 )
-# Use a fixed secret key for development to preserve session data
-app.secret_key = 'your-fixed-development-secret-key'
+# Sessions are signed cookies, so the key must stay private: take it from the
+# environment or a random key kept in the user's home directory
+app.secret_key = load_secret_key()
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
 app.config['SEND_FILE_MAX_AGE_DEFAULT'] = timedelta(days=1)
 app.config.update(
-    SESSION_TYPE='filesystem',
-    SESSION_FILE_DIR=tempfile.gettempdir(),
-    SESSION_FILE_THRESHOLD=500,
-    PERMANENT_SESSION_LIFETIME=1800  # 30 minutes
+    PERMANENT_SESSION_LIFETIME=1800,  # 30 minutes
+    # Sessions only hold cache tokens and a few short strings, so Flask's
+    # signed cookie session is enough and no session file is written per request
+    SESSION_REFRESH_EACH_REQUEST=False
 )
 
-# Create a dedicated session directory
-SESSION_DIR = os.path.join(tempfile.gettempdir(), 'flask_session')
-if not os.path.exists(SESSION_DIR):
-    os.makedirs(SESSION_DIR)
-
-# Clear existing session files
-def cleanup_session_files():
-    try:
-        if os.path.exists(SESSION_DIR):
-            shutil.rmtree(SESSION_DIR)
-            os.makedirs(SESSION_DIR)
-    except Exception as e:
-        app.logger.warning(f"Failed to cleanup session files: {e}")
-
-# Configure Flask-Session with better error handling
-app.config.update({
-    'SESSION_TYPE': 'filesystem',
-    'SESSION_FILE_DIR': SESSION_DIR,
-    'SESSION_FILE_THRESHOLD': 100,
-    'SESSION_FILE_MODE': 0o600,
-    'PERMANENT_SESSION_LIFETIME': 1800,
-    'SESSION_REFRESH_EACH_REQUEST': True
-})
-
-# Initialize session with error handling
-try:
-    Session(app)
-except Exception as e:
-    app.logger.error(f"Session initialization failed: {e}")
-    cleanup_session_files()
+# Deployments running several workers can keep sessions in Redis instead by
+# setting SESSION_REDIS_URL (requires the flask-session and redis packages)
+SESSION_REDIS_URL = os.environ.get('SESSION_REDIS_URL')
+if SESSION_REDIS_URL:
+    import redis
+    from flask_session import Session
+    app.config.update(
+        SESSION_TYPE='redis',
+        SESSION_REDIS=redis.from_url(SESSION_REDIS_URL),
+        SESSION_USE_SIGNER=True
+    )
     Session(app)
 
-@app.before_request
-def session_handler():
+# Behind nginx/Apache, set USE_X_SENDFILE=1 so the web server streams generated
+# documents itself; otherwise send_file hands the open file to the WSGI
+# server's file_wrapper (sendfile(2) under gunicorn)
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+
+# Large session payloads (parsed DataFrames, raw JSON) live in CACHE_DIR;
+# the session only keeps a random token per payload, mapped here to a file suffix.
+# DataFrames are stored as parquet so a cache file is only ever data, never code.
+SESSION_CACHE_FILES = {
+    'df_key': '.parquet',
+    'raw_json_key': '.json'
+}
+SESSION_TOKEN_PATTERN = re.compile(r'[0-9a-f]{32}')
+CACHE_SWEEP_INTERVAL = 300  # seconds between cache sweeps
+_last_cache_sweep = 0.0
+
+# Recently stored DataFrames, keyed by session token, so the routes that follow
+# an upload don't have to read the parquet file again. The file stays the source
+# of truth for other workers and restarts.
+DATAFRAME_MEMORY_SIZE = 16
+_dataframe_memory = OrderedDict()
+_dataframe_memory_lock = threading.Lock()
+
+def _remember_dataframe(token, df):
+    with _dataframe_memory_lock:
+        _dataframe_memory[token] = df
+        _dataframe_memory.move_to_end(token)
+        while len(_dataframe_memory) > DATAFRAME_MEMORY_SIZE:
+            _dataframe_memory.popitem(last=False)
+
+def sweep_session_cache(max_age=None):
+    """Delete cached session files older than the session lifetime"""
+    global _last_cache_sweep
+    now = time.time()
+    if now - _last_cache_sweep < CACHE_SWEEP_INTERVAL:
+        return
+    _last_cache_sweep = now
+    if max_age is None:
+        max_age = app.permanent_session_lifetime.total_seconds()
+    for path in CACHE_DIR.iterdir():
+        try:
+            if now - path.stat().st_mtime > max_age:
+                path.unlink()
+        except OSError as e:
+            logger.warning(f"Failed to remove cached data {path}: {e}")
+
+def session_cache_path(key):
+    """Return the cache file behind a session key, or None if nothing is stored"""
+    token = session.get(key)
+    if not isinstance(token, str) or not SESSION_TOKEN_PATTERN.fullmatch(token):
+        return None
+    path = (CACHE_DIR / f"{token}{SESSION_CACHE_FILES[key]}").resolve()
+    if path.parent != CACHE_DIR.resolve():
+        return None
+    return path
+
+def discard_session_file(key):
+    """Remove the cache file referenced by a session key, if any"""
+    path = session_cache_path(key)
+    token = session.pop(key, None)
+    if token:
+        with _dataframe_memory_lock:
+            _dataframe_memory.pop(token, None)
+    if path:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+def _new_session_file(key):
+    sweep_session_cache()
+    discard_session_file(key)
+    session[key] = uuid.uuid4().hex
+    return session_cache_path(key)
+
+def store_session_dataframe(df):
+    """Write a DataFrame to the cache and keep only its token in the session"""
+    path = _new_session_file('df_key')
+    df = df.reset_index(drop=True)
     try:
-        # Attempt to access session to trigger any potential errors
-        session.get('test')
-    except OSError:
-        # If session is corrupted, clear it
-        cleanup_session_files()
+        df.to_parquet(path, index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Arrow needs one type per column; store mixed object columns as text
+        stored = df.copy()
+        for column in stored.select_dtypes(include='object').columns:
+            stored[column] = stored[column].map(
+                lambda v: v if isinstance(v, str) else None if pd.isna(v) else str(v))
+        stored.to_parquet(path, index=False)
+    _remember_dataframe(session['df_key'], df)
+
+def load_session_dataframe():
+    """Load the session's cached DataFrame, or None if it is missing or expired"""
+    path = session_cache_path('df_key')
+    if path is None or not path.exists():
+        return None
+    token = session['df_key']
+    with _dataframe_memory_lock:
+        df = _dataframe_memory.get(token)
+        if df is not None:
+            _dataframe_memory.move_to_end(token)
+            return df
+    df = pd.read_parquet(path)
+    _remember_dataframe(token, df)
+    return df
+
+def store_session_raw_json(raw_json):
+    """Write the source JSON text to the cache and keep only its token in the session"""
+    path = _new_session_file('raw_json_key')
+    if isinstance(raw_json, bytes):
+        path.write_bytes(raw_json)
+    else:
+        path.write_text(raw_json, encoding='utf-8')
+
+def load_session_raw_json():
+    """Return the session's source JSON text, or None if it is missing or expired"""
+    path = session_cache_path('raw_json_key')
+    if path is None or not path.exists():
+        return None
+    return path.read_text(encoding='utf-8')
 
 # Helper function to get resource path (for templates)
 def resource_path(relative_path):
@@ -157,8 +356,15 @@ def resource_path(relative_path):
         return os.path.join(sys._MEIPASS, relative_path)
     return os.path.join(os.path.abspath("."), relative_path)
 
+def _config_mtime():
+    try:
+        return os.path.getmtime(CONFIG_FILE)
+    except OSError:
+        return None
+
 # Load configurations or create default
-def load_config():
+@lru_cache(maxsize=1)
+def _load_config_cached(mtime):
     config = configparser.ConfigParser()
     
     # Default configurations
@@ -186,48 +392,79 @@ def load_config():
     
     return config
 
+def load_config():
+    """
+    Return the application config, reparsing the INI file only when its
+    modification time changes. The parser is shared between requests, so
+    changes must be persisted with save_config().
+    """
+    return _load_config_cached(_config_mtime())
+
 def save_config(config):
-    with open(CONFIG_FILE, 'w') as f:
+    # Write to a temp file and swap it in, so a concurrent load_config never
+    # parses (and caches) a half-written file
+    tmp_path = f"{CONFIG_FILE}.tmp"
+    with open(tmp_path, 'w') as f:
         config.write(f)
+    os.replace(tmp_path, CONFIG_FILE)
+    _load_config_cached.cache_clear()
 
 # Helper to adjust font sizes after rendering
-def adjust_table_font_sizes(doc_path):
+# Table font size (pt) by line length: <=30 chars → 12pt, <=45 → 10pt,
+# <=60 → 8pt; longer lines fall back to 7pt
+FONT_SIZE_BY_LENGTH = (12,) * 31 + (10,) * 15 + (8,) * 15
+FALLBACK_FONT_SIZE = 7
+
+def _run_text(run):
+    """Text of a w:r element, matching python-docx's Run.text"""
+    parts = []
+    for child in run:
+        if child.tag == qn('w:t'):
+            parts.append(child.text or '')
+        elif child.tag == qn('w:tab'):
+            parts.append('\t')
+        elif child.tag in (qn('w:br'), qn('w:cr')):
+            parts.append('\n')
+    return ''.join(parts)
+
+def apply_table_font_sizes(document_element):
+    """
+    Adjust font sizes inside table cells of a parsed w:document element in place.
+    Works directly on the XML so no python-docx Table/Cell/Paragraph objects are built.
+    """
+    for cell in document_element.xpath('./w:body/w:tbl/w:tr/w:tc'):
+        for position, paragraph in enumerate(cell.xpath('./w:p')):
+            runs = paragraph.xpath('./w:r')
+            text = ''.join(_run_text(run) for run in runs).strip()
+            if not text:
+                continue
+
+            # If line is Product Name (first line), force 10pt
+            if position == 0:
+                font_size = 10
+            elif len(text) < len(FONT_SIZE_BY_LENGTH):
+                font_size = FONT_SIZE_BY_LENGTH[len(text)]
+            else:
+                font_size = FALLBACK_FONT_SIZE
+
+            for run in runs:
+                run.get_or_add_rPr().sz_val = Pt(font_size)
+
+def append_page_body(master, page):
     """
-    Post-process a DOCX file to dynamically adjust font size inside table cells based on thresholds.
+    Append the body of a page rendered from the same template as master.
+    Styles, numbering and relationships are shared, so unlike docxcompose's
+    Composer nothing needs remapping; the page's section properties are dropped.
     """
-    thresholds = [
-        (30, 12),   # <=30 chars → 12pt
-        (45, 10),   # <=45 chars → 10pt
-        (60, 8),    # <=60 chars → 8pt
-        (float('inf'), 7)  # >60 chars → 7pt
-    ]
-
-    def get_font_size(text_len):
-        for limit, size in thresholds:
-            if text_len <= limit:
-                return size
-        return 7  # Fallback
-
-    doc = Document(doc_path)
-
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for paragraph in cell.paragraphs:
-                    text = paragraph.text.strip()
-                    if not text:
-                        continue
-
-                    # If line is Product Name (first line), force 10pt
-                    if paragraph == cell.paragraphs[0]:
-                        font_size = 10
-                    else:
-                        font_size = get_font_size(len(text))
-
-                    for run in paragraph.runs:
-                        run.font.size = Pt(font_size)
-
-    doc.save(doc_path)
+    body = master.element.body
+    sect_pr = body.sectPr
+    for element in list(page.element.body):
+        if element.tag == qn('w:sectPr'):
+            continue
+        if sect_pr is not None:
+            sect_pr.addprevious(element)
+        else:
+            body.append(element)
 
 # Open files after saving
 def open_file(path):
@@ -236,9 +473,11 @@ def open_file(path):
         if sys.platform == "win32":
             os.startfile(path)
         elif sys.platform == "darwin":  # macOS
-            os.system(f'open "{path}"')
+            subprocess.Popen(["open", path], stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL, close_fds=True)
         else:  # linux variants
-            os.system(f'xdg-open "{path}"')
+            subprocess.Popen(["xdg-open", path], stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL, close_fds=True)
     except Exception as e:
         logger.error(f"Error opening file: {e}")
         flash(f"Error opening file: {e}", "error")
@@ -248,6 +487,38 @@ def chunk_records(records, chunk_size=4):
     for i in range(0, len(records), chunk_size):
         yield records[i:i + chunk_size]
 
+def build_label_rows(df):
+    """
+    Return one row of label values per record, ordered like LABEL_COLUMNS.
+    Vendor names in "license - name" form are reduced to the name, and
+    blank vendors become "Unknown Vendor".
+    """
+    labels = df.reindex(columns=list(LABEL_COLUMNS.values())).fillna("")
+    vendor = labels["Vendor"].astype(str)
+    vendor = vendor.str.split(" - ").str[1].fillna(vendor)
+    labels["Vendor"] = vendor.mask(vendor == "", "Unknown Vendor")
+    return labels.to_numpy(dtype=object)
+
+@lru_cache(maxsize=8)
+def load_template_bytes(template_path, mtime):
+    """Return the raw template file, cached until its modification time changes"""
+    with open(template_path, 'rb') as f:
+        return f.read()
+
+def render_slip_page(template_bytes, chunk, items_per_page):
+    """Render one page of labels and return the rendered python-docx Document"""
+    tpl = DocxTemplate(BytesIO(template_bytes))
+    context = {f"Label{idx}": dict(zip(LABEL_COLUMNS, row))
+               for idx, row in enumerate(chunk, 1)}
+
+    # Fill remaining slots with empty values
+    for i in range(len(chunk) + 1, items_per_page + 1):
+        context[f"Label{i}"] = EMPTY_LABEL
+
+    # The rendered Document is used as-is instead of saving and reparsing it
+    tpl.render(context)
+    return tpl.docx
+
 # Check if file extension is allowed
 def allowed_file(filename):
     return '.' in filename and \
@@ -272,64 +543,35 @@ def run_full_process_inventory_slips(selected_df, config, status_callback=None,
         if status_callback:
             status_callback("Processing data...")
 
-        records = selected_df.to_dict(orient="records")
-        pages = []
+        records = build_label_rows(selected_df)
 
-        # Process records in chunks of 4 (or configured size)
-        total_chunks = (len(records) + items_per_page - 1) // items_per_page
-        current_chunk = 0
+        # Each page renders from an in-memory copy of the cached template
+        template_bytes = load_template_bytes(template_path, os.path.getmtime(template_path))
 
-        for chunk in chunk_records(records, items_per_page):
-            current_chunk += 1
-            if progress_callback:
-                progress = (current_chunk / total_chunks) * 50
-                progress_callback(int(progress))
+        # Process records in chunks of 4 (or configured size); pages render
+        # concurrently and are stored by position so their order is kept
+        chunks = list(chunk_records(records, items_per_page))
+        total_chunks = len(chunks)
+        pages = [None] * total_chunks
+
+        with ThreadPoolExecutor(max_workers=RENDER_WORKERS) as executor:
+            futures = {
+                executor.submit(render_slip_page, template_bytes, chunk, items_per_page): page_num
+                for page_num, chunk in enumerate(chunks)
+            }
+            for completed, future in enumerate(as_completed(futures), 1):
+                page_num = futures[future]
+                try:
+                    pages[page_num] = future.result()
+                except Exception as e:
+                    raise ValueError(f"Error generating page {page_num + 1}: {e}")
 
-            if status_callback:
-                status_callback(f"Generating page {current_chunk} of {total_chunks}...")
+                if progress_callback:
+                    progress = (completed / total_chunks) * 50
+                    progress_callback(int(progress))
 
-            try:
-                tpl = DocxTemplate(template_path)
-                context = {}
-
-                # Fill context with records - modified vendor handling
-                for idx, record in enumerate(chunk, 1):
-                    # Get vendor info, using full vendor name if available
-                    vendor_name = record.get("Vendor", "")
-                    # If vendor is in format "license - name", extract just the name
-                    if " - " in vendor_name:
-                        vendor_name = vendor_name.split(" - ")[1]
-                    
-                    context[f"Label{idx}"] = {
-                        "ProductName": record.get("Product Name*", ""),
-                        "Barcode": record.get("Barcode*", ""),
-                        "AcceptedDate": record.get("Accepted Date", ""),
-                        "QuantityReceived": record.get("Quantity Received*", ""),
-                        "Vendor": vendor_name or "Unknown Vendor",  # Only use Unknown if empty
-                        "ProductType": record.get("Product Type*", "")
-                    }
-
-                # Fill remaining slots with empty values
-                for i in range(len(chunk) + 1, items_per_page + 1):
-                    context[f"Label{i}"] = {
-                        "ProductName": "",
-                        "Barcode": "",
-                        "AcceptedDate": "",
-                        "QuantityReceived": "",
-                        "Vendor": "",
-                        "ProductType": ""
-                    }
-
-                # Render template with context
-                tpl.render(context)
-                
-                # Save to BytesIO
-                output = BytesIO()
-                tpl.save(output)
-                pages.append(Document(output))
-
-            except Exception as e:
-                raise ValueError(f"Error generating page {current_chunk}: {e}")
+                if status_callback:
+                    status_callback(f"Generated page {completed} of {total_chunks}...")
 
         if not pages:
             return False, "No documents generated."
@@ -339,28 +581,27 @@ def run_full_process_inventory_slips(selected_df, config, status_callback=None,
             status_callback("Combining pages...")
 
         master = pages[0]
-        composer = Composer(master)
         for i, doc in enumerate(pages[1:]):
             if progress_callback:
                 progress = 50 + ((i + 1) / len(pages[1:])) * 40
                 progress_callback(int(progress))
-            composer.append(doc)
+            append_page_body(master, doc)
 
         # Save final document
         now = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         outname = f"inventory_slips_{now}.docx"
         outpath = os.path.join(config['PATHS']['output_dir'], outname)
 
+        # Adjust font sizes in memory so the document is written only once
+        if status_callback:
+            status_callback("Adjusting formatting...")
+        apply_table_font_sizes(master.element)
+
         if status_callback:
             status_callback("Saving document...")
 
         master.save(outpath)
 
-        # Adjust font sizes
-        if status_callback:
-            status_callback("Adjusting formatting...")
-        adjust_table_font_sizes(outpath)
-
         if progress_callback:
             progress_callback(100)
 
@@ -371,6 +612,39 @@ def run_full_process_inventory_slips(selected_df, config, status_callback=None,
             status_callback(f"Error: {str(e)}")
         return False, str(e)
 
+# Column helpers shared by the JSON parsers. Items are loaded into an object
+# frame so integer quantities and IDs keep their original Python types.
+def _item_column(items_df, name, default=""):
+    """Return an item field as a column, filling missing values with default"""
+    if name not in items_df:
+        return pd.Series(default, index=items_df.index, dtype=object)
+    return items_df[name].fillna(default)
+
+def _nested_column(items_df, parent, name, default=""):
+    """Return a field of a nested item object (e.g. product.name) as a column"""
+    if parent not in items_df:
+        return pd.Series(default, index=items_df.index, dtype=object)
+    return items_df[parent].str.get(name).fillna(default)
+
+def _first_truthy(primary, fallback):
+    """Vectorized equivalent of `primary or fallback` per row"""
+    return primary.where(primary.astype(bool), fallback)
+
+def _lab_results(items_df, parent, name=None):
+    """Explode per-item lab result lists into one row per result, indexed by item"""
+    if parent not in items_df:
+        return pd.Series(dtype=object)
+    results = items_df[parent]
+    if name is not None:
+        results = results.str.get(name)
+    return results.explode().dropna()
+
+def _pick_lab_value(values, mask, index, keep="last", default=""):
+    """Select one matching lab value per item and align it to the item index"""
+    picked = values[mask]
+    picked = picked[~picked.index.duplicated(keep=keep)]
+    return picked.reindex(index, fill_value=default)
+
 # Parse Bamboo transfer schema JSON
 def parse_bamboo_data(json_data):
     if not json_data:
@@ -389,35 +663,29 @@ def parse_bamboo_data(json_data):
         # Process inventory items
         items = json_data.get("inventory_transfer_items", [])
         logger.info(f"Bamboo data: found {len(items)} inventory_transfer_items")
-        records = []
+        if not items:
+            return pd.DataFrame()
         
-        for item in items:
-            # Extract THC and CBD content from lab_result_data if available
-            thc_content = ""
-            cbd_content = ""
-            
-            lab_data = item.get("lab_result_data", {})
-            if lab_data and "potency" in lab_data:
-                for potency_item in lab_data["potency"]:
-                    if potency_item.get("type") == "total-thc":
-                        thc_content = f"{potency_item.get('value', '')}%"
-                    elif potency_item.get("type") == "total-cbd":
-                        cbd_content = f"{potency_item.get('value', '')}%"
-            
-            records.append({
-                "Product Name*": item.get("product_name", ""),
-                "Product Type*": item.get("inventory_type", ""),
-                "Quantity Received*": item.get("qty", ""),
-                "Barcode*": item.get("inventory_id", "") or item.get("external_id", ""),
-                "Accepted Date": accepted_date,
-                "Vendor": vendor_meta,
-                "Strain Name": item.get("strain_name", ""),
-                "THC Content": thc_content,
-                "CBD Content": cbd_content,
-                "Source System": "Bamboo"
-            })
-        
-        return pd.DataFrame(records)
+        items_df = pd.DataFrame(items, dtype=object)
+        
+        # Extract THC and CBD content from lab_result_data if available
+        potency = _lab_results(items_df, "lab_result_data", "potency")
+        potency_types = potency.str.get("type")
+        potency_values = potency.str.get("value").fillna("").astype(str) + "%"
+        
+        return pd.DataFrame({
+            "Product Name*": _item_column(items_df, "product_name"),
+            "Product Type*": _item_column(items_df, "inventory_type"),
+            "Quantity Received*": _item_column(items_df, "qty"),
+            "Barcode*": _first_truthy(_item_column(items_df, "inventory_id"),
+                                      _item_column(items_df, "external_id")),
+            "Accepted Date": accepted_date,
+            "Vendor": vendor_meta,
+            "Strain Name": _item_column(items_df, "strain_name"),
+            "THC Content": _pick_lab_value(potency_values, potency_types == "total-thc", items_df.index),
+            "CBD Content": _pick_lab_value(potency_values, potency_types == "total-cbd", items_df.index),
+            "Source System": "Bamboo"
+        }).infer_objects()
     
     except Exception as e:
         raise ValueError(f"Failed to parse Bamboo transfer data: {e}")
@@ -447,38 +715,31 @@ def parse_cultivera_data(json_data):
         
         # Process inventory items
         items = manifest.get("items", [])
-        records = []
+        if not items:
+            return pd.DataFrame()
         
-        for item in items:
-            # Extract product info
-            product = item.get("product", {})
-            
-            # Extract THC and CBD content
-            thc_content = ""
-            cbd_content = ""
-            
-            test_results = item.get("test_results", [])
-            if test_results:
-                for result in test_results:
-                    if "thc" in result.get("type", "").lower():
-                        thc_content = f"{result.get('percentage', '')}%"
-                    elif "cbd" in result.get("type", "").lower():
-                        cbd_content = f"{result.get('percentage', '')}%"
-            
-            records.append({
-                "Product Name*": product.get("name", ""),
-                "Product Type*": product.get("category", ""),
-                "Quantity Received*": item.get("quantity", ""),
-                "Barcode*": item.get("barcode", "") or item.get("id", ""),
-                "Accepted Date": accepted_date,
-                "Vendor": vendor_meta,
-                "Strain Name": product.get("strain_name", ""),
-                "THC Content": thc_content,
-                "CBD Content": cbd_content,
-                "Source System": "Cultivera"
-            })
-        
-        return pd.DataFrame(records)
+        items_df = pd.DataFrame(items, dtype=object)
+        
+        # Extract THC and CBD content; a result matching "thc" is never counted as CBD
+        results = _lab_results(items_df, "test_results")
+        result_types = results.str.get("type").fillna("").astype(str).str.lower()
+        result_values = results.str.get("percentage").fillna("").astype(str) + "%"
+        is_thc = result_types.str.contains("thc", regex=False)
+        is_cbd = ~is_thc & result_types.str.contains("cbd", regex=False)
+        
+        return pd.DataFrame({
+            "Product Name*": _nested_column(items_df, "product", "name"),
+            "Product Type*": _nested_column(items_df, "product", "category"),
+            "Quantity Received*": _item_column(items_df, "quantity"),
+            "Barcode*": _first_truthy(_item_column(items_df, "barcode"),
+                                      _item_column(items_df, "id")),
+            "Accepted Date": accepted_date,
+            "Vendor": vendor_meta,
+            "Strain Name": _nested_column(items_df, "product", "strain_name"),
+            "THC Content": _pick_lab_value(result_values, is_thc, items_df.index),
+            "CBD Content": _pick_lab_value(result_values, is_cbd, items_df.index),
+            "Source System": "Cultivera"
+        }).infer_objects()
     
     except Exception as e:
         raise ValueError(f"Failed to parse Cultivera data: {e}")
@@ -511,35 +772,63 @@ def parse_growflow_data(json_data):
         accepted_date = raw_date.split("T")[0] if "T" in raw_date else raw_date
         
         items = json_data.get("inventory_transfer_items", [])
-        mapped_data = []
-        
-        for item in items:
-            potency_data = item.get("lab_result_data", {}).get("potency", [])
-            # Look for total-thc (or fallback to thc) and total-cbd (or cbd)
-            thc_value = next((p.get('value') for p in potency_data if p.get('type') in ["total-thc", "thc"]), 0)
-            cbd_value = next((p.get('value') for p in potency_data if p.get('type') in ["total-cbd", "cbd"]), 0)
-            
-            mapped_item = {
-                "Product Name*": item.get("product_name", ""),
-                "Product Type*": item.get("inventory_type", ""),
-                "Quantity Received*": item.get("qty", ""),
-                # Prefer product_sku first then inventory_id
-                "Barcode*": item.get("product_sku", "") or item.get("inventory_id", ""),
-                "Accepted Date": accepted_date,
-                "Vendor": vendor_meta,
-                "Strain Name": item.get("strain_name", ""),
-                "THC Content": f"{thc_value}%",
-                "CBD Content": f"{cbd_value}%",
-                "Source System": "GrowFlow"
-            }
-            mapped_data.append(mapped_item)
+        if not items:
+            return pd.DataFrame()
         
-        return pd.DataFrame(mapped_data)
+        items_df = pd.DataFrame(items, dtype=object)
+        
+        # Look for total-thc (or fallback to thc) and total-cbd (or cbd)
+        potency = _lab_results(items_df, "lab_result_data", "potency")
+        potency_types = potency.str.get("type")
+        potency_values = potency.str.get("value")
+        thc_values = _pick_lab_value(potency_values, potency_types.isin(["total-thc", "thc"]),
+                                     items_df.index, keep="first", default=0)
+        cbd_values = _pick_lab_value(potency_values, potency_types.isin(["total-cbd", "cbd"]),
+                                     items_df.index, keep="first", default=0)
+        
+        return pd.DataFrame({
+            "Product Name*": _item_column(items_df, "product_name"),
+            "Product Type*": _item_column(items_df, "inventory_type"),
+            "Quantity Received*": _item_column(items_df, "qty"),
+            # Prefer product_sku first then inventory_id
+            "Barcode*": _first_truthy(_item_column(items_df, "product_sku"),
+                                      _item_column(items_df, "inventory_id")),
+            "Accepted Date": accepted_date,
+            "Vendor": vendor_meta,
+            "Strain Name": _item_column(items_df, "strain_name"),
+            "THC Content": thc_values.astype(str) + "%",
+            "CBD Content": cbd_values.astype(str) + "%",
+            "Source System": "GrowFlow"
+        }).infer_objects()
     
     except Exception as e:
         logger.error(f"Error parsing GrowFlow data: {str(e)}")
         return pd.DataFrame()
 
+# Keys that identify each supported export; a payload containing none of them
+# can be rejected without parsing it
+JSON_FORMAT_MARKERS = ('"inventory_transfer_items"', '"manifest"', '"document_schema_version"')
+UNKNOWN_JSON_FORMAT = "Unknown JSON format. Please use Bamboo or Cultivera format."
+
+def detect_json_format(json_data):
+    """Return the source system of parsed JSON data, or None if unrecognised"""
+    if not isinstance(json_data, dict):
+        return None
+    if "inventory_transfer_items" in json_data:
+        return "Bamboo"
+    data = json_data.get("data")
+    if isinstance(data, dict) and "manifest" in data:
+        return "Cultivera"
+    if "document_schema_version" in json_data:
+        return "GrowFlow"
+    return None
+
+JSON_PARSERS = {
+    "Bamboo": parse_bamboo_data,
+    "Cultivera": parse_cultivera_data,
+    "GrowFlow": parse_growflow_data
+}
+
 # Detect and parse JSON from multiple systems
 def parse_inventory_json(json_data):
     """
@@ -549,38 +838,70 @@ def parse_inventory_json(json_data):
         return None, "No data provided"
     
     try:
-        # If data is a string, parse it to JSON
-        if isinstance(json_data, str):
-            json_data = json.loads(json_data)
-        
-        # Try parsing as Bamboo
-        if "inventory_transfer_items" in json_data:
-            return parse_bamboo_data(json_data), "Bamboo"
-        
-        # Try parsing as Cultivera
-        elif "data" in json_data and isinstance(json_data["data"], dict) and "manifest" in json_data["data"]:
-            return parse_cultivera_data(json_data), "Cultivera"
-        
-        # Try parsing as GrowFlow
-        elif "document_schema_version" in json_data:
-            return parse_growflow_data(json_data), "GrowFlow"
-        
-        # Unknown format
-        else:
-            return None, "Unknown JSON format. Please use Bamboo or Cultivera format."
+        # If data is a string, check for a format marker before parsing it
+        if isinstance(json_data, (str, bytes)):
+            markers = JSON_FORMAT_MARKERS
+            if isinstance(json_data, bytes):
+                markers = [marker.encode() for marker in markers]
+            if not any(marker in json_data for marker in markers):
+                return None, UNKNOWN_JSON_FORMAT
+            json_data = json_loads(json_data)
+        
+        format_type = detect_json_format(json_data)
+        if format_type is None:
+            return None, UNKNOWN_JSON_FORMAT
+        return JSON_PARSERS[format_type](json_data), format_type
     
     except json.JSONDecodeError:
         return None, "Invalid JSON data. Please check the format."
     except Exception as e:
         return None, f"Error parsing data: {str(e)}"
 
+# Read an uploaded CSV file
+def read_csv_upload(file):
+    """
+    Read an uploaded CSV into a DataFrame, using pyarrow's multithreaded
+    parser when it is installed. Every column is read as text so barcodes
+    keep leading zeros and dates are not turned into timestamps.
+    """
+    if pacsv is None:
+        return pd.read_csv(file)
+
+    # Parse straight from the upload stream (spooled to disk by werkzeug for
+    # large files) rather than copying the whole body into memory first
+    stream = getattr(file, 'stream', file)
+    header_line = stream.readline().decode('utf-8-sig')
+    stream.seek(0)
+    header = next(csv.reader([header_line]), [])
+    table = pacsv.read_csv(
+        stream,
+        convert_options=pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            strings_can_be_null=True
+        )
+    )
+    return table.to_pandas()
+
+# Columns process_csv_data looks up by substring after renaming
+CSV_KEY_COLUMNS = ("Product Name*", "Barcode*", "Vendor", "Accepted Date", "Product Type*", "Strain Name")
+
+def index_columns(columns, names=CSV_KEY_COLUMNS):
+    """Map each name to the first column containing it (None if absent) in one pass"""
+    found = dict.fromkeys(names)
+    for col in columns:
+        for name in names:
+            if found[name] is None and name in col:
+                found[name] = col
+    return found
+
 # Process CSV data
 def process_csv_data(df):
     try:
         logger.info(f"Original columns: {df.columns.tolist()}")
         
         # First, ensure column names are unique by adding a suffix if needed
-        df.columns = [f"{col}_{i}" if df.columns.tolist().count(col) > 1 else col 
+        column_counts = Counter(df.columns)
+        df.columns = [f"{col}_{i}" if column_counts[col] > 1 else col 
                      for i, col in enumerate(df.columns)]
         logger.info(f"Columns after ensuring uniqueness: {df.columns.tolist()}")
         
@@ -624,46 +945,44 @@ def process_csv_data(df):
         df = df.rename(columns=new_columns)
         logger.info(f"Columns after renaming: {df.columns.tolist()}")
         
+        # Locate the key columns in a single pass over the header
+        key_columns = index_columns(df.columns)
+        
         # Ensure required columns exist
         required_cols = ["Product Name*", "Barcode*"]
-        missing_cols = [col for col in required_cols if not any(col in c for c in df.columns)]
+        missing_cols = [col for col in required_cols if key_columns[col] is None]
         
         if missing_cols:
             return None, f"CSV is missing required columns: {', '.join(missing_cols)}"
         
         # Set default values for missing columns
-        if not any("Vendor" in c for c in df.columns):
+        vendor_col = key_columns["Vendor"]
+        if vendor_col is None:
             df["Vendor"] = "Unknown Vendor"
         else:
-            vendor_col = next(c for c in df.columns if "Vendor" in c)
             df[vendor_col] = df[vendor_col].fillna("Unknown Vendor")
         
-        if not any("Accepted Date" in c for c in df.columns):
+        if key_columns["Accepted Date"] is None:
             today = datetime.datetime.today().strftime("%Y-%m-%d")
             df["Accepted Date"] = today
         
-        if not any("Product Type*" in c for c in df.columns):
+        if key_columns["Product Type*"] is None:
             df["Product Type*"] = "Unknown"
+            key_columns["Product Type*"] = "Product Type*"
         
-        if not any("Strain Name" in c for c in df.columns):
+        if key_columns["Strain Name"] is None:
             df["Strain Name"] = ""
         
         # Sort if possible
         try:
-            sort_cols = []
-            if any("Product Type*" in c for c in df.columns):
-                sort_cols.append(next(c for c in df.columns if "Product Type*" in c))
-            if any("Product Name*" in c for c in df.columns):
-                sort_cols.append(next(c for c in df.columns if "Product Name*" in c))
-            
-            if sort_cols:
-                df = df.sort_values(sort_cols, ascending=[True, True])
-        except:
+            sort_cols = [key_columns["Product Type*"], key_columns["Product Name*"]]
+            df = df.sort_values(sort_cols)
+        except Exception:
             pass  # If sorting fails, continue without sorting
         
         # Final check for duplicate columns
         if len(df.columns) != len(set(df.columns)):
-            duplicates = [col for col in df.columns if df.columns.tolist().count(col) > 1]
+            duplicates = [col for col, count in Counter(df.columns).items() if count > 1]
             logger.error(f"Duplicate columns found: {duplicates}")
             return None, f"Duplicate columns found: {', '.join(duplicates)}"
         
@@ -679,15 +998,15 @@ def index():
     # Load configuration
     config = load_config()
     
-    # Load any previously saved data from session
-    df_json = session.get('df_json', None)
+    # Check for previously loaded data in the session
+    has_data = 'df_key' in session
     format_type = session.get('format_type', None)
     
     return render_template(
         'index.html',
         version=APP_VERSION,
         theme=config['SETTINGS'].get('theme', 'dark'),
-        df_json=df_json,
+        has_data=has_data,
         format_type=format_type,
         config=config  # Pass the application config instead of Flask config
     )
@@ -711,7 +1030,7 @@ def upload_csv():
         try:
             # Read CSV
             logger.info('Reading CSV file')
-            df = pd.read_csv(file)
+            df = read_csv_upload(file)
             logger.info(f'CSV columns: {df.columns.tolist()}')
             
             # Process CSV
@@ -723,9 +1042,9 @@ def upload_csv():
                 flash(f'Error: {message}')
                 return redirect(url_for('index'))
             
-            # Store in session (convert DataFrame to JSON for storage)
-            logger.info('Converting DataFrame to JSON')
-            session['df_json'] = result_df.to_json(orient='records')
+            # Store in the server-side cache
+            logger.info('Caching processed DataFrame')
+            store_session_dataframe(result_df)
             session['format_type'] = 'CSV'
             
             flash('CSV file processed successfully')
@@ -755,7 +1074,8 @@ def upload_json():
     if file and allowed_file(file.filename):
         try:
             # Read JSON
-            json_data = json.load(file)
+            raw_data = file.read()
+            json_data = json_loads(raw_data)
             
             # Process JSON
             result_df, format_type = parse_inventory_json(json_data)
@@ -765,9 +1085,9 @@ def upload_json():
                 return redirect(url_for('index'))
             
             # Store in session
-            session['df_json'] = result_df.to_json(orient='records')
+            store_session_dataframe(result_df)
             session['format_type'] = format_type
-            session['raw_json'] = json.dumps(json_data)
+            store_session_raw_json(raw_data)
             
             flash(f'{format_type} data processed successfully')
             return redirect(url_for('data_view'))
@@ -787,11 +1107,11 @@ def paste_json():
         
         # Process JSON based on format
         if api_format == 'bamboo':
-            data = json.loads(json_data)
+            data = json_loads(json_data)
             result_df = parse_bamboo_data(data)
             format_type = 'Bamboo'
         elif api_format == 'cultivera':
-            data = json.loads(json_data)
+            data = json_loads(json_data)
             result_df = parse_cultivera_data(data)
             format_type = 'Cultivera'
         else:
@@ -803,9 +1123,9 @@ def paste_json():
             return redirect(url_for('index'))
         
         # Store in session
-        session['df_json'] = result_df.to_json(orient='records')
+        store_session_dataframe(result_df)
         session['format_type'] = format_type
-        session['raw_json'] = json_data
+        store_session_raw_json(json_data)
         
         flash(f'{format_type} data imported successfully')
         return redirect(url_for('data_view'))
@@ -839,44 +1159,34 @@ def load_from_url(url):
         return redirect(url_for('index'))
 
     try:
-        import ssl
-        # Create an SSL context that does not verify certificates
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-
         headers = {
             'User-Agent': f'InventorySlipGenerator/{APP_VERSION}',
             'Accept': 'application/json'
         }
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, context=ssl_context, timeout=10) as resp:
-            raw_data = resp.read()
-            if not raw_data:
-                raise ValueError("Empty response received")
-            decoded_data = raw_data.decode('utf-8', errors='strict').strip()
-            if not decoded_data:
-                raise ValueError("Empty response after decoding")
-            # Attempt to load the JSON; log a snippet if it fails
-            try:
-                data = json.loads(decoded_data)
-            except json.JSONDecodeError as jde:
-                logger.error("JSON decoding error. Response snippet:\n%s", decoded_data[:200])
-                raise ValueError(f"Invalid JSON format: {str(jde)}")
-            
-            if not isinstance(data, (dict, list)):
-                raise ValueError("Invalid JSON structure - expecting object or array")
-            
-            result_df, format_type = parse_inventory_json(data)
-            if result_df is None or result_df.empty:
-                raise ValueError(f"Could not process data: {format_type}")
-            
-            session['df_json'] = result_df.to_json(orient='records')
-            session['format_type'] = format_type
-            session['raw_json'] = json.dumps(data)
-            
-            flash(f'{format_type} data loaded successfully', 'success')
-            return redirect(url_for('data_view'))
+        raw_data = fetch_url(url, headers=headers, verify=False, timeout=10)
+        if not raw_data.strip():
+            raise ValueError("Empty response received")
+        # Parse the response bytes directly; log a snippet if it fails
+        try:
+            data = json_loads(raw_data)
+        except json.JSONDecodeError as jde:
+            logger.error("JSON decoding error. Response snippet:\n%s",
+                         raw_data[:200].decode('utf-8', errors='replace'))
+            raise ValueError(f"Invalid JSON format: {str(jde)}")
+        
+        if not isinstance(data, (dict, list)):
+            raise ValueError("Invalid JSON structure - expecting object or array")
+        
+        result_df, format_type = parse_inventory_json(data)
+        if result_df is None or result_df.empty:
+            raise ValueError(f"Could not process data: {format_type}")
+        
+        store_session_dataframe(result_df)
+        session['format_type'] = format_type
+        store_session_raw_json(raw_data)
+        
+        flash(f'{format_type} data loaded successfully', 'success')
+        return redirect(url_for('data_view'))
     except Exception as e:
         logger.error(f'Error loading URL: {str(e)}', exc_info=True)
         flash(f'Failed to load data: {str(e)}', 'error')
@@ -885,12 +1195,6 @@ def load_from_url(url):
 def handle_bamboo_url(url):
     """Handle Bamboo-specific URL loading with API key support"""
     try:
-        import ssl
-        # Create an SSL context that does not verify certificates
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-
         # Set up headers
         headers = {
             'User-Agent': f'InventorySlipGenerator/{APP_VERSION}',
@@ -903,10 +1207,9 @@ def handle_bamboo_url(url):
         if 'API' in config and config['API'].get('bamboo_key'):
             headers['Authorization'] = f"Bearer {config['API']['bamboo_key']}"
         
-        # Fetch data using our SSL context
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, context=ssl_context, timeout=10) as resp:
-            data = json.loads(resp.read().decode())
+        # Fetch data without certificate verification
+        raw_data = fetch_url(url, headers=headers, verify=False, timeout=10)
+        data = json_loads(raw_data)
             
         # Process Bamboo data
         result_df = parse_bamboo_data(data)
@@ -915,15 +1218,18 @@ def handle_bamboo_url(url):
             return redirect(url_for('index'))
         
         # Store in session
-        session['df_json'] = result_df.to_json(orient='records')
+        store_session_dataframe(result_df)
         session['format_type'] = 'Bamboo'
-        session['raw_json'] = json.dumps(data)
+        store_session_raw_json(raw_data)
         
-        # Cache the response (optional)
+        # Cache the response bytes as received (optional); write to a temp
+        # file first so a failed write never leaves a truncated cache behind
         cache_dir = os.path.join(os.path.expanduser("~"), ".inventory_slip_cache")
         os.makedirs(cache_dir, exist_ok=True)
-        with open(os.path.join(cache_dir, "bamboo_latest.json"), 'w') as f:
-            json.dump(data, f)
+        cache_file = os.path.join(cache_dir, "bamboo_latest.json")
+        with open(f"{cache_file}.tmp", 'wb') as f:
+            f.write(raw_data)
+        os.replace(f"{cache_file}.tmp", cache_file)
         
         # Update recent URLs
         recent_urls = config['PATHS'].get('recent_urls', '').split('|')
@@ -953,8 +1259,9 @@ def handle_bamboo_forbidden():
         cache_file = os.path.join(os.path.expanduser("~"), ".inventory_slip_cache", "bamboo_latest.json")
         
         if os.path.exists(cache_file):
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
+            with open(cache_file, 'rb') as f:
+                raw_data = f.read()
+            data = json_loads(raw_data)
             
             result_df = parse_bamboo_data(data)
             
@@ -962,9 +1269,9 @@ def handle_bamboo_forbidden():
                 flash('Could not process cached Bamboo data', 'error')
                 return redirect(url_for('index'))
             
-            session['df_json'] = result_df.to_json(orient='records')
+            store_session_dataframe(result_df)
             session['format_type'] = 'Bamboo'
-            session['raw_json'] = json.dumps(data)
+            store_session_raw_json(raw_data)
             
             flash('Using cached Bamboo data (API access forbidden). Please check your API credentials.', 'warning')
             return redirect(url_for('data_view'))
@@ -1006,9 +1313,8 @@ def fetch_api():
         save_config(config)
         
         # Fetch data
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req) as resp:
-            data = json.loads(resp.read().decode())
+        raw_data = fetch_url(url, headers=headers)
+        data = json_loads(raw_data)
         
         # Process based on API type
         if api_type == 'bamboo':
@@ -1026,9 +1332,9 @@ def fetch_api():
             return redirect(url_for('index'))
         
         # Store in session
-        session['df_json'] = result_df.to_json(orient='records')
+        store_session_dataframe(result_df)
         session['format_type'] = format_type
-        session['raw_json'] = json.dumps(data)
+        store_session_raw_json(raw_data)
         
         # Add to recent URLs
         recent_urls = config['PATHS'].get('recent_urls', '').split('|')
@@ -1048,43 +1354,25 @@ def fetch_api():
 
 @app.route('/data-view')
 def data_view():
-    if 'data' not in session:
+    df = load_session_dataframe()
+    if df is None:
         return redirect(url_for('index'))
     
-    df_json = session['data']
-    # Fix deprecation warning by using StringIO
-    df = pd.read_json(StringIO(df_json), orient='records')
-    
     # Group by Product Type
     df = df.sort_values(['Product Type*', 'Product Name*'])
     
-    # Generate styled HTML table with grouped products
-    styled_df = df.style.set_table_styles([
-        {'selector': 'thead', 
-         'props': [('background-color', '#009879'), 
-                  ('color', 'white'),
-                  ('font-weight', 'bold')]},
-        {'selector': 'tbody tr:nth-of-type(even)', 
-         'props': [('background-color', '#f3f3f3')]},
-    ]).set_properties(**{
-        'border': '1px solid #ddd',
-        'padding': '8px'
-    })
-    
+    # Table styling lives in static/style.css under .styled-table
     return render_template(
         'data_view.html',
-        table=styled_df.to_html(classes='styled-table', index=False)
+        table=df.to_html(classes='styled-table', index=False, border=0)
     )
 
 @app.route('/generate-slips', methods=['POST'])
 def generate_slips():
-    if 'data' not in session:
+    df = load_session_dataframe()
+    if df is None:
         return redirect(url_for('index'))
     
-    df_json = session['data']
-    # Fix deprecation warning here too
-    df = pd.read_json(StringIO(df_json), orient='records')
-    
     try:
         # Get selected products
         selected_indices = request.form.getlist('selected_indices[]')
@@ -1096,8 +1384,8 @@ def generate_slips():
         # Convert indices to integers
         selected_indices = [int(idx) for idx in selected_indices]
         
-        # Get only selected rows
-        selected_df = df.iloc[selected_indices].copy()
+        # Get only selected rows; the label builder never mutates them, so no copy
+        selected_df = df.iloc[selected_indices]
         
         # Load configuration
         config = load_config()
@@ -1205,7 +1493,7 @@ def settings():
 
 @app.route('/view-json')
 def view_json():
-    raw_json = session.get('raw_json', None)
+    raw_json = load_session_raw_json()
     format_type = session.get('format_type', None)
     
     if raw_json is None:
@@ -1226,9 +1514,9 @@ def view_json():
 @app.route('/clear-data')
 def clear_data():
     # Clear session data
-    session.pop('df_json', None)
+    discard_session_file('df_key')
     session.pop('format_type', None)
-    session.pop('raw_json', None)
+    discard_session_file('raw_json_key')
     session.pop('output_file', None)
     
     flash('Data cleared successfully')
@@ -1253,15 +1541,15 @@ def search_json_or_api():
     # Try to detect if input is a URL
     if user_input.startswith('http://') or user_input.startswith('https://'):
         try:
-            with urllib.request.urlopen(user_input) as resp:
-                data = json.loads(resp.read().decode())
+            raw_data = fetch_url(user_input)
+            data = json_loads(raw_data)
             result_df, format_type = parse_inventory_json(data)
             if result_df is None or result_df.empty:
                 flash(f'Could not process data from URL.')
                 return redirect(url_for('index'))
-            session['df_json'] = result_df.to_json(orient='records')
+            store_session_dataframe(result_df)
             session['format_type'] = format_type
-            session['raw_json'] = json.dumps(data)
+            store_session_raw_json(raw_data)
             flash(f'{format_type} data loaded successfully from URL')
             return redirect(url_for('data_view'))
         except Exception as e:
@@ -1270,14 +1558,14 @@ def search_json_or_api():
     else:
         # Try to parse as JSON
         try:
-            data = json.loads(user_input)
+            data = json_loads(user_input)
             result_df, format_type = parse_inventory_json(data)
             if result_df is None or result_df.empty:
                 flash(f'Could not process pasted JSON data.')
                 return redirect(url_for('index'))
-            session['df_json'] = result_df.to_json(orient='records')
+            store_session_dataframe(result_df)
             session['format_type'] = format_type
-            session['raw_json'] = user_input
+            store_session_raw_json(user_input)
             flash(f'{format_type} data imported successfully')
             return redirect(url_for('data_view'))
         except Exception as e:
@@ -1324,9 +1612,6 @@ def select_directory():
         'message': 'Invalid directory selected'
     }), 400
 
-import subprocess
-from flask import jsonify
-
 @app.route('/open_downloads')
 def open_downloads():
     downloads_dir = get_downloads_dir()  # This function returns the appropriate downloads folder
@@ -1341,16 +1626,10 @@ def open_downloads():
     except Exception as e:
         return jsonify(success=False, message=str(e))
 
-def compress_data(data):
-    return zlib.compress(str(data).encode())
-
-def decompress_data(compressed_data):
-    return zlib.decompress(compressed_data).decode()
-
 def process_json_data(json_data):
     try:
-        if isinstance(json_data, str):
-            data = json.loads(json_data)
+        if isinstance(json_data, (str, bytes)):
+            data = json_loads(json_data)
         else:
             data = json_data
             
@@ -1367,44 +1646,37 @@ def process_json_data(json_data):
         logging.error(f"Unexpected error processing JSON: {str(e)}")
         return None
 
+NO_STORE_CACHE_CONTROL = 'no-store, no-cache, must-revalidate, max-age=0'
+
 @app.after_request
 def add_header(response):
-    if 'Cache-Control' not in response.headers:
-        if request.path.startswith('/static/') or request.path in ['/style.css', '/js/script.js', '/images/logo.png']:
-            response.headers['Cache-Control'] = 'public, max-age=86400'
-        else:
-            response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
+    # Static files already carry a one-day Cache-Control from SEND_FILE_MAX_AGE_DEFAULT
+    if request.endpoint == 'static':
+        return response
+    response.headers.setdefault('Cache-Control', NO_STORE_CACHE_CONTROL)
     return response
 
-if __name__ == '__main__':
-    import socket
-    import threading
-    import time
-    import webbrowser
+def port_is_free(port, host='localhost'):
+    """Return True if nothing is listening on host:port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        try:
+            sock.bind((host, port))
+        except OSError:
+            return False
+    return True
 
-    def is_port_available(port):
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            try:
-                s.bind(('localhost', port))
-                return True
-            except Exception:
-                return False
-
-    # Choose an available port from the list
-    available_ports = [5000, 8000, 8080, 8888]
-    chosen_port = None
-    for port in available_ports:
-        if is_port_available(port):
-            chosen_port = port
-            break
-
-    if chosen_port is None:
+if __name__ == '__main__':
+    # werkzeug exits the process instead of raising when its bind fails, so
+    # probe each candidate port before handing it to app.run
+    candidate_ports = [5000, 8000, 8080, 8888]
+    port = next((p for p in candidate_ports if port_is_free(p)), None)
+    if port is None:
         print("Could not find an available port.")
-    else:
-        def open_browser():
-            time.sleep(1.0)  # allow server to start
-            webbrowser.open(f'http://localhost:{chosen_port}')
-        threading.Thread(target=open_browser, daemon=True).start()
+        sys.exit(1)
+
+    browser_timer = threading.Timer(1.0, webbrowser.open, args=(f'http://localhost:{port}',))
+    browser_timer.daemon = True
+    browser_timer.start()
 
-        print(f"Starting server on port {chosen_port}...")
-        app.run(debug=True, host='localhost', port=chosen_port, use_reloader=False)
\ No newline at end of file
+    print(f"Starting server on port {port}...")
+    app.run(debug=True, host='localhost', port=port, use_reloader=False)
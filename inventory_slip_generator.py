@@ -5,22 +5,177 @@ import sys
 import json
 import datetime
 import urllib.request
+import urllib.error
+import urllib3
 import pandas as pd
+import numpy as np
 from io import BytesIO
 from docxtpl import DocxTemplate
 from docx import Document
+import jinja2
 from docx.shared import Pt
-from docxcompose.composer import Composer
+from docx.oxml.ns import qn
 import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import multiprocessing
 import configparser
 import webbrowser
 import re
+import hashlib
+from bisect import bisect_left
+from itertools import repeat
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
 
 # Constants
 CONFIG_FILE = os.path.expanduser("~/inventory_generator_config.ini")
 DEFAULT_SAVE_DIR = os.path.expanduser("~/Downloads")
 APP_VERSION = "2.0.0"
 
+# Template label fields and the DataFrame columns that fill them
+LABEL_COLUMNS = {
+    "ProductName": "Product Name*",
+    "Barcode": "Barcode*",
+    "AcceptedDate": "Accepted Date",
+    "QuantityReceived": "Quantity Received*",
+    "Vendor": "Vendor",
+    "StrainName": "Strain Name",
+    "ProductType": "Product Type*",
+    "THCContent": "THC Content",
+    "CBDContent": "CBD Content"
+}
+EMPTY_LABEL = dict.fromkeys(LABEL_COLUMNS, "")
+
+# Columns used when a primary label column is missing from the data
+LABEL_COLUMN_FALLBACKS = {
+    "Quantity Received*": "Quantity*",
+    "Product Type*": "Inventory Type"
+}
+
+class TemplateCachingEnvironment(jinja2.Environment):
+    """
+    Jinja environment that keeps the last template compiled by from_string.
+    docxtpl hands the same patched body XML to from_string for every page,
+    and Jinja's own cache does not cover from_string, so without this each
+    page would compile the template again.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._compiled = {}
+
+    def from_string(self, source, globals=None, template_class=None):
+        if globals or template_class is not None:
+            return super().from_string(source, globals, template_class)
+        template = self._compiled.get(source)
+        if template is None:
+            template = super().from_string(source)
+            # Only the template currently in use is kept
+            self._compiled = {source: template}
+        return template
+
+# Jinja environment shared by every page render, so each template is compiled
+# once per process rather than once per page
+JINJA_ENV = TemplateCachingEnvironment()
+
+# docxtpl's Jinja and regex work holds the GIL, so pages render in worker
+# processes. Each worker renders a batch of pages and returns it as one docx.
+RENDER_WORKERS = os.cpu_count() or 1
+PAGES_PER_BATCH = 25
+
+# Shared connection pool so repeated fetches reuse keep-alive connections.
+# Connection failures are retried; a stalled server times out instead of
+# leaving the import waiting forever.
+HTTP = urllib3.PoolManager(
+    num_pools=4,
+    maxsize=10,
+    retries=urllib3.Retry(total=2, backoff_factor=0.3),
+    timeout=urllib3.Timeout(connect=5, read=30)
+)
+
+# Responses fetched with cache=True are kept here with their ETag and
+# Last-Modified, so an unchanged resource is answered with a 304
+RESPONSE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".inventory_slip_cache", "responses")
+
+def _write_file(path, data):
+    # Write to a temporary file first so a partial write never replaces the cache;
+    # the name is per thread so overlapping writes don't share one temp file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def fetch_url(url, headers=None, cache=False):
+    """
+    GET a URL through the shared connection pool and return the body bytes.
+    Error statuses raise urllib.error.HTTPError so callers can inspect e.code.
+    With cache set, the last body is revalidated with If-None-Match /
+    If-Modified-Since and reused when the server answers 304.
+    """
+    headers = dict(headers or {})
+    if not cache:
+        resp = HTTP.request('GET', url, headers=headers)
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        return resp.data
+    
+    # Credentials are part of the key so different API keys don't share a body
+    key = hashlib.sha1(f"{url}\n{headers.get('Authorization', '')}".encode()).hexdigest()
+    body_path = os.path.join(RESPONSE_CACHE_DIR, key + ".body")
+    meta_path = os.path.join(RESPONSE_CACHE_DIR, key + ".meta")
+    
+    validators = {}
+    if os.path.exists(body_path) and os.path.exists(meta_path):
+        try:
+            with open(meta_path, 'rb') as f:
+                validators = json.loads(f.read())
+        except (OSError, ValueError):
+            validators = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    
+    resp = HTTP.request('GET', url, headers=headers)
+    if resp.status == 304 and validators:
+        with open(body_path, 'rb') as f:
+            return f.read()
+    if resp.status >= 400:
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+    
+    validators = {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified")
+    }
+    if validators["etag"] or validators["last_modified"]:
+        try:
+            os.makedirs(RESPONSE_CACHE_DIR, exist_ok=True)
+            _write_file(body_path, resp.data)
+            _write_file(meta_path, json.dumps(validators).encode())
+        except OSError:
+            pass  # The fetch still succeeded; it just won't be revalidated
+    return resp.data
+
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps_pretty(obj):
+    """Serialize an object to indented JSON text, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
     if hasattr(sys, '_MEIPASS'):
@@ -61,43 +216,60 @@ def save_config(config):
         config.write(f)
 
 # Helper to adjust font sizes after rendering
-def adjust_table_font_sizes(doc_path):
-    """
-    Post-process a DOCX file to dynamically adjust font size inside table cells based on thresholds.
-    """
-    thresholds = [
-        (30, 12),   # <=30 chars → 12pt
-        (45, 10),   # <=45 chars → 10pt
-        (60, 8),    # <=60 chars → 8pt
-        (float('inf'), 7)  # >60 chars → 7pt
-    ]
-
-    def get_font_size(text_len):
-        for limit, size in thresholds:
-            if text_len <= limit:
-                return size
-        return 7  # Fallback
+# Table font size by line length: <=30 chars → 12pt, <=45 → 10pt, <=60 → 8pt,
+# longer → 7pt. Product names (first line of a cell) are always 10pt.
+FONT_SIZE_LIMITS = (30, 45, 60)
+FONT_SIZES = (Pt(12), Pt(10), Pt(8), Pt(7))
+PRODUCT_NAME_FONT_SIZE = Pt(10)
 
-    doc = Document(doc_path)
+def _run_text(run):
+    """Text of a w:r element, matching python-docx's Run.text"""
+    parts = []
+    for child in run:
+        if child.tag == qn('w:t'):
+            parts.append(child.text or '')
+        elif child.tag == qn('w:tab'):
+            parts.append('\t')
+        elif child.tag in (qn('w:br'), qn('w:cr')):
+            parts.append('\n')
+    return ''.join(parts)
 
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for paragraph in cell.paragraphs:
-                    text = paragraph.text.strip()
-                    if not text:
-                        continue
+def apply_table_font_sizes(document_element):
+    """
+    Adjust font sizes inside table cells of a parsed w:document element in place.
+    Works directly on the XML so no python-docx Table/Cell/Paragraph objects are built.
+    """
+    for cell in document_element.xpath('./w:body/w:tbl/w:tr/w:tc'):
+        for position, paragraph in enumerate(cell.xpath('./w:p')):
+            runs = paragraph.xpath('./w:r')
+            text = ''.join(_run_text(run) for run in runs).strip()
+            if not text:
+                continue
 
-                    # If line is Product Name (first line), force 10pt
-                    if paragraph == cell.paragraphs[0]:
-                        font_size = 10
-                    else:
-                        font_size = get_font_size(len(text))
+            # If line is Product Name (first line), force 10pt
+            if position == 0:
+                font_size = PRODUCT_NAME_FONT_SIZE
+            else:
+                font_size = FONT_SIZES[bisect_left(FONT_SIZE_LIMITS, len(text))]
 
-                    for run in paragraph.runs:
-                        run.font.size = Pt(font_size)
+            for run in runs:
+                run.get_or_add_rPr().sz_val = font_size
 
-    doc.save(doc_path)
+def append_page_body(master, page):
+    """
+    Append the body of a page rendered from the same template as master.
+    Styles, numbering and relationships are shared, so unlike docxcompose's
+    Composer nothing needs remapping; the page's section properties are dropped.
+    """
+    body = master.element.body
+    sect_pr = body.sectPr
+    for element in list(page.element.body):
+        if element.tag == qn('w:sectPr'):
+            continue
+        if sect_pr is not None:
+            sect_pr.addprevious(element)
+        else:
+            body.append(element)
 
 # Open files after saving
 def open_file(path):
@@ -116,6 +288,52 @@ def chunk_records(records, chunk_size=4):
     for i in range(0, len(records), chunk_size):
         yield records[i:i + chunk_size]
 
+def build_label_rows(df):
+    """
+    Return one tuple of label values per record, ordered like LABEL_COLUMNS.
+    Missing columns use their LABEL_COLUMN_FALLBACKS column or stay blank, and
+    quantities are truncated to whole numbers (blank when not numeric).
+    """
+    columns = [
+        column if column in df or column not in LABEL_COLUMN_FALLBACKS
+        else LABEL_COLUMN_FALLBACKS[column]
+        for column in LABEL_COLUMNS.values()
+    ]
+    labels = df.reindex(columns=columns)
+    labels.columns = list(LABEL_COLUMNS)
+
+    # Comparing with inf drops NaN and infinite values in one step
+    qty = pd.to_numeric(labels["QuantityReceived"], errors="coerce")
+    qty = qty[qty.abs() < float("inf")].astype("int64").astype(object)
+    labels["QuantityReceived"] = qty.reindex(labels.index, fill_value="")
+
+    return list(labels.fillna("").itertuples(index=False, name=None))
+
+def display_quantities(df):
+    """
+    Return the quantity shown for each record in the product list: Quantity
+    Received*, or Quantity* where that is blank, truncated to a whole number
+    when numeric and otherwise shown as text.
+    """
+    qty = pd.Series(None, index=df.index, dtype=object)
+    for column in ("Quantity Received*", "Quantity*"):
+        if column in df.columns:
+            qty = qty.where(qty.notna(), df[column])
+
+    display = np.full(len(qty), "", dtype=object)
+    present = qty.notna().to_numpy()
+    display[present] = qty[present].astype(str).to_numpy()
+
+    # Comparing with inf drops NaN and infinite values in one step
+    numbers = pd.to_numeric(qty, errors="coerce")
+    finite = (numbers.abs() < float("inf")).to_numpy()
+    display[finite] = numbers[finite].astype("int64").to_numpy().astype(object)
+    return display
+
+def add_bindtag(widget, tag):
+    """Let a widget receive the events bound to tag with bind_class"""
+    widget.bindtags(widget.bindtags() + (tag,))
+
 # Create tooltips for UI elements
 class ToolTip:
     def __init__(self, widget, text):
@@ -150,6 +368,141 @@ class ToolTip:
             self.tooltip.destroy()
             self.tooltip = None
 
+# Product list rows are drawn by a small pool of recycled widgets placed on the
+# canvas, so only the rows in view exist as Tk widgets however many are loaded
+PRODUCT_ROW_HEIGHT = 60
+PRODUCT_LIST_BINDTAG = "ProductList"  # product list widgets that scroll it
+
+# Delay after the last keystroke before the product list is filtered
+SEARCH_DELAY_MS = 150
+
+class ProductListRow:
+    """A recycled product list row, shown as either a group header or a product"""
+    def __init__(self, canvas, on_toggle):
+        self.canvas = canvas
+        self.position = None
+        self.entry = None
+        self.item_width = None  # None while hidden
+        
+        self.frame = ttk.Frame(canvas, style="TFrame")
+        self.var = tk.BooleanVar()
+        self.checkbutton = ttk.Checkbutton(
+            self.frame,
+            variable=self.var,
+            command=lambda: on_toggle(self),
+            style="TCheckbutton"
+        )
+        self.checkbutton.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Strain, SKU and Quantity labels
+        info_frame = ttk.Frame(self.frame, style="TFrame")
+        info_frame.pack(side=tk.RIGHT)
+        self.strain_label = ttk.Label(info_frame, style="ProductInfo.TLabel")
+        self.sku_label = ttk.Label(info_frame, style="ProductInfo.TLabel")
+        self.qty_label = ttk.Label(info_frame, style="ProductQty.TLabel")
+        for label in (self.strain_label, self.sku_label, self.qty_label):
+            label.pack(side=tk.TOP, anchor=tk.E)
+        
+        for widget in (self.frame, self.checkbutton, info_frame,
+                       self.strain_label, self.sku_label, self.qty_label):
+            add_bindtag(widget, PRODUCT_LIST_BINDTAG)
+        
+        self.window = canvas.create_window(0, 0, window=self.frame, anchor="nw", state="hidden")
+    
+    def show(self, position, entry, selected, width):
+        """Draw entry at the given list position"""
+        self.position = position
+        self.var.set(selected)
+        
+        # Labels are only rewritten when the row shows a different entry;
+        # redraws after a selection change leave them as they are
+        indent = 5 if entry[0] == "group" else 10
+        if entry is not self.entry:
+            self.entry = entry
+            if entry[0] == "group":
+                product_type = entry[1]
+                self.checkbutton.configure(text=f"Select/Deselect {product_type}")
+                self.strain_label.configure(text="")
+                self.sku_label.configure(text="")
+                self.qty_label.configure(text="")
+            else:
+                _, _, _, product_name, strain_name, sku, qty = entry
+                self.checkbutton.configure(text=product_name)
+                self.strain_label.configure(text=f"Strain: {strain_name}" if strain_name else "")
+                self.sku_label.configure(text=f"SKU: {sku}")
+                self.qty_label.configure(text=f"Qty: {qty}")
+        
+        self.canvas.coords(self.window, indent, position * PRODUCT_ROW_HEIGHT)
+        
+        # Resizing the window makes Tk lay the row out again, so only do it
+        # when the row is being shown again or its width changed
+        item_width = max(width - 2 * indent, 1)
+        if item_width != self.item_width:
+            self.canvas.itemconfig(
+                self.window,
+                width=item_width,
+                height=PRODUCT_ROW_HEIGHT - 4,
+                state="normal"
+            )
+            self.item_width = item_width
+    
+    def hide(self):
+        self.position = None
+        self.entry = None
+        self.item_width = None
+        self.canvas.itemconfig(self.window, state="hidden")
+
+class CachedDocxTemplate(DocxTemplate):
+    """
+    DocxTemplate built from template bytes that reuses the patched body XML.
+    Extracting and patching the body is the same for every page rendered from
+    one template, so it is done once per template (and process) and only the
+    Jinja render runs per page.
+    """
+    _patched_body_xml = {}
+
+    def __init__(self, template_bytes):
+        super().__init__(BytesIO(template_bytes))
+        self.template_bytes = template_bytes
+
+    def build_xml(self, context, jinja_env=None):
+        xml = self._patched_body_xml.get(self.template_bytes)
+        if xml is None:
+            xml = self.patch_xml(self.get_xml())
+            # Only the template currently in use is kept
+            self._patched_body_xml.clear()
+            self._patched_body_xml[self.template_bytes] = xml
+        return self.render_xml_part(xml, self.docx._part, context, jinja_env)
+
+def render_slip_page(template_bytes, chunk, items_per_page):
+    """Render one page of labels and return it as a python-docx Document"""
+    tpl = CachedDocxTemplate(template_bytes)
+    
+    # Skip rows with no product name, barcode or quantity, then pad with blanks
+    labels = [dict(zip(LABEL_COLUMNS, row)) for row in chunk]
+    labels = [label for label in labels
+              if label["ProductName"] or label["Barcode"] or label["QuantityReceived"]]
+    labels += [EMPTY_LABEL] * (items_per_page - len(labels))
+    context = {f"Label{idx}": label for idx, label in enumerate(labels, 1)}
+    
+    # The rendered Document is used as-is instead of saving and reparsing it
+    tpl.render(context, JINJA_ENV)
+    return tpl.docx
+
+def render_slip_batch(template_bytes, chunks, items_per_page):
+    """Render consecutive pages and merge them into a single Document"""
+    pages = [render_slip_page(template_bytes, chunk, items_per_page) for chunk in chunks]
+    master = pages[0]
+    for page in pages[1:]:
+        append_page_body(master, page)
+    return master
+
+def render_slip_batch_bytes(template_bytes, chunks, items_per_page):
+    """Worker process entry point: render a batch and return it as docx bytes"""
+    buf = BytesIO()
+    render_slip_batch(template_bytes, chunks, items_per_page).save(buf)
+    return buf.getvalue()
+
 # Process and save inventory slips - with progress feedback
 def run_full_process_inventory_slips(selected_df, config, status_callback=None, progress_callback=None):
     if selected_df.empty:
@@ -173,102 +526,81 @@ def run_full_process_inventory_slips(selected_df, config, status_callback=None,
         if status_callback:
             status_callback("Processing data...")
         
-        records = selected_df.to_dict(orient="records")
-        pages = []
+        records = build_label_rows(selected_df)
         
-        # Progress calculation
-        total_chunks = (len(records) + items_per_page - 1) // items_per_page
-        current_chunk = 0
+        # Read the template once; each page renders from an in-memory copy
+        with open(template_path, 'rb') as f:
+            template_bytes = f.read()
         
-        for chunk in chunk_records(records, items_per_page):
-            current_chunk += 1
-            if progress_callback:
-                progress_value = (current_chunk / total_chunks) * 50  # First half of progress
-                progress_callback(int(progress_value))
-            
-            if status_callback:
-                status_callback(f"Generating page {current_chunk} of {total_chunks}...")
-            
-            try:
-                tpl = DocxTemplate(template_path)
-                context = {}
-                
-                slot_num = 1
-                for rec in chunk:
-                    product_name = rec.get("Product Name*", "")
-                    barcode = rec.get("Barcode*", "")
-                    qty = rec.get("Quantity Received*", rec.get("Quantity*", ""))
-                    
-                    if not product_name and not barcode and not qty:
-                        continue
-                    
-                    try:
-                        qty = int(float(qty))
-                    except (ValueError, TypeError):
-                        qty = ""
-                    
-                    context[f"Label{slot_num}"] = {
-                        "ProductName": product_name,
-                        "Barcode": barcode,
-                        "AcceptedDate": rec.get("Accepted Date", ""),
-                        "QuantityReceived": qty,
-                        "Vendor": rec.get("Vendor", ""),
-                        "StrainName": rec.get("Strain Name", ""),
-                        "ProductType": rec.get("Product Type*", rec.get("Inventory Type", "")),
-                        "THCContent": rec.get("THC Content", ""),
-                        "CBDContent": rec.get("CBD Content", "")
-                    }
-                    slot_num += 1
-                
-                # Fill empty slots
-                for i in range(slot_num, items_per_page + 1):
-                    context[f"Label{i}"] = {
-                        "ProductName": "",
-                        "Barcode": "",
-                        "AcceptedDate": "",
-                        "QuantityReceived": "",
-                        "Vendor": "",
-                        "StrainName": "",
-                        "ProductType": "",
-                        "THCContent": "",
-                        "CBDContent": ""
-                    }
-                
-                tpl.render(context)
-                buf = BytesIO()
-                tpl.save(buf)
-                pages.append(Document(buf))
-                
-            except Exception as e:
-                return False, f"Error generating page {current_chunk}: {e}"
+        chunks = list(chunk_records(records, items_per_page))
+        total_chunks = len(chunks)
+        batches = [chunks[i:i + PAGES_PER_BATCH] for i in range(0, total_chunks, PAGES_PER_BATCH)]
         
-        if not pages:
+        if not batches:
             return False, "No documents generated."
         
-        if status_callback:
-            status_callback("Combining pages...")
-        
-        master = pages[0]
-        composer = Composer(master)
-        for i, doc in enumerate(pages[1:]):
+        if len(batches) == 1:
+            # Small jobs render in-process; starting workers would cost more than it saves
+            if status_callback:
+                status_callback(f"Generating {total_chunks} page(s)...")
+            try:
+                master = render_slip_batch(template_bytes, chunks, items_per_page)
+            except Exception as e:
+                return False, f"Error generating pages: {e}"
+            
             if progress_callback:
-                progress_value = 50 + ((i + 1) / len(pages[1:])) * 25  # Second quarter of progress
-                progress_callback(int(progress_value))
-            composer.append(doc)
+                progress_callback(75)
+        else:
+            # Batches are stored by position so the page order is kept
+            docs = [None] * len(batches)
+            pages_done = 0
+            
+            with ProcessPoolExecutor(max_workers=min(RENDER_WORKERS, len(batches))) as executor:
+                futures = {
+                    executor.submit(render_slip_batch_bytes, template_bytes, batch, items_per_page): batch_num
+                    for batch_num, batch in enumerate(batches)
+                }
+                for future in as_completed(futures):
+                    batch_num = futures[future]
+                    first_page = batch_num * PAGES_PER_BATCH + 1
+                    last_page = first_page + len(batches[batch_num]) - 1
+                    try:
+                        docs[batch_num] = Document(BytesIO(future.result()))
+                    except Exception as e:
+                        return False, f"Error generating pages {first_page}-{last_page}: {e}"
+                    
+                    pages_done += len(batches[batch_num])
+                    if progress_callback:
+                        progress_value = (pages_done / total_chunks) * 50  # First half of progress
+                        progress_callback(int(progress_value))
+                    
+                    if status_callback:
+                        status_callback(f"Generated page {pages_done} of {total_chunks}...")
+            
+            if status_callback:
+                status_callback("Combining pages...")
+            
+            master = docs[0]
+            for i, doc in enumerate(docs[1:]):
+                if progress_callback:
+                    progress_value = 50 + ((i + 1) / len(docs[1:])) * 25  # Second quarter of progress
+                    progress_callback(int(progress_value))
+                append_page_body(master, doc)
         
         now = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         outname = f"{now}_inventory_slips.docx"
         outpath = os.path.join(output_dir, outname)
         
+        # Adjust font sizes in memory so the document is written only once
         if status_callback:
-            status_callback("Saving document...")
+            status_callback("Adjusting formatting...")
         
-        master.save(outpath)
+        apply_table_font_sizes(master.element)
         
         if status_callback:
-            status_callback("Adjusting formatting...")
+            status_callback("Saving document...")
         
-        adjust_table_font_sizes(outpath)
+        master.save(outpath)
         
         if progress_callback:
             progress_callback(100)  # Complete progress
@@ -290,61 +622,63 @@ def run_full_process_inventory_slips(selected_df, config, status_callback=None,
 
 # Theme colors
 class ThemeColors:
-    def __init__(self, theme="dark"):
-        # Define theme colors
-        self.themes = {
-            "dark": {
-                "bg_main": "#1E1E2E",
-                "bg_secondary": "#181825",
-                "fg_main": "#CDD6F4",
-                "fg_secondary": "#BAC2DE",
-                "accent": "#89B4FA",
-                "highlight": "#F5C2E7",
-                "button_bg": "#313244",
-                "button_fg": "#CDD6F4",
-                "checkbox_bg": "#45475A",
-                "checkbox_fg": "#F5C2E7",
-                "entry_bg": "#313244",
-                "entry_fg": "#CDD6F4",
-                "success": "#A6E3A1",
-                "error": "#F38BA8",
-                "warning": "#FAB387"
-            },
-            "light": {
-                "bg_main": "#EFF1F5",
-                "bg_secondary": "#CCD0DA",
-                "fg_main": "#4C4F69",
-                "fg_secondary": "#5C5F77",
-                "accent": "#1E66F5",
-                "highlight": "#EA76CB",
-                "button_bg": "#DCE0E8",
-                "button_fg": "#4C4F69",
-                "checkbox_bg": "#BCC0CC",
-                "checkbox_fg": "#EA76CB",
-                "entry_bg": "#DCE0E8",
-                "entry_fg": "#4C4F69",
-                "success": "#40A02B",
-                "error": "#D20F39",
-                "warning": "#FE640B"
-            },
-            "green": {
-                "bg_main": "#1A2F1A",
-                "bg_secondary": "#132613",
-                "fg_main": "#B8E6B8",
-                "fg_secondary": "#99CC99",
-                "accent": "#40A02B",
-                "highlight": "#73D35F",
-                "button_bg": "#2D4B2D",
-                "button_fg": "#B8E6B8",
-                "checkbox_bg": "#3A5F3A",
-                "checkbox_fg": "#73D35F",
-                "entry_bg": "#2D4B2D",
-                "entry_fg": "#B8E6B8",
-                "success": "#40A02B",
-                "error": "#E64545",
-                "warning": "#FFA500"
-            }
+    # Theme colors, shared by every instance
+    THEMES = {
+        "dark": {
+            "bg_main": "#1E1E2E",
+            "bg_secondary": "#181825",
+            "fg_main": "#CDD6F4",
+            "fg_secondary": "#BAC2DE",
+            "accent": "#89B4FA",
+            "highlight": "#F5C2E7",
+            "button_bg": "#313244",
+            "button_fg": "#CDD6F4",
+            "checkbox_bg": "#45475A",
+            "checkbox_fg": "#F5C2E7",
+            "entry_bg": "#313244",
+            "entry_fg": "#CDD6F4",
+            "success": "#A6E3A1",
+            "error": "#F38BA8",
+            "warning": "#FAB387"
+        },
+        "light": {
+            "bg_main": "#EFF1F5",
+            "bg_secondary": "#CCD0DA",
+            "fg_main": "#4C4F69",
+            "fg_secondary": "#5C5F77",
+            "accent": "#1E66F5",
+            "highlight": "#EA76CB",
+            "button_bg": "#DCE0E8",
+            "button_fg": "#4C4F69",
+            "checkbox_bg": "#BCC0CC",
+            "checkbox_fg": "#EA76CB",
+            "entry_bg": "#DCE0E8",
+            "entry_fg": "#4C4F69",
+            "success": "#40A02B",
+            "error": "#D20F39",
+            "warning": "#FE640B"
+        },
+        "green": {
+            "bg_main": "#1A2F1A",
+            "bg_secondary": "#132613",
+            "fg_main": "#B8E6B8",
+            "fg_secondary": "#99CC99",
+            "accent": "#40A02B",
+            "highlight": "#73D35F",
+            "button_bg": "#2D4B2D",
+            "button_fg": "#B8E6B8",
+            "checkbox_bg": "#3A5F3A",
+            "checkbox_fg": "#73D35F",
+            "entry_bg": "#2D4B2D",
+            "entry_fg": "#B8E6B8",
+            "success": "#40A02B",
+            "error": "#E64545",
+            "warning": "#FFA500"
         }
+    }
+    
+    def __init__(self, theme="dark"):
+        self.themes = self.THEMES
         
         # Default to dark theme if requested theme doesn't exist
         self.current = self.themes.get(theme, self.themes["dark"])
@@ -358,6 +692,48 @@ class ThemeColors:
             return True
         return False
 
+# Column helpers shared by the JSON parsers. Items are loaded into an object
+# frame so integer quantities and IDs keep their original Python types.
+def _item_column(items_df, name, default=""):
+    """Return an item field as a column, filling missing values with default"""
+    if name not in items_df:
+        return pd.Series(default, index=items_df.index, dtype=object)
+    return items_df[name].fillna(default)
+
+def _nested_column(items_df, parent, name, default=""):
+    """Return a field of a nested item object (e.g. product.name) as a column"""
+    if parent not in items_df:
+        return pd.Series(default, index=items_df.index, dtype=object)
+    return items_df[parent].str.get(name).fillna(default)
+
+def _first_truthy(primary, fallback):
+    """Vectorized equivalent of `primary or fallback` per row"""
+    return primary.where(primary.astype(bool), fallback)
+
+def _lab_results(items_df, parent, name=None):
+    """Explode per-item lab result lists into one row per result, indexed by item"""
+    if parent not in items_df:
+        return pd.Series(dtype=object)
+    results = items_df[parent]
+    if name is not None:
+        results = results.str.get(name)
+    return results.explode().dropna()
+
+def _potency_kind(result_type):
+    """Classify a lab result type as "thc", "cbd" or None by substring, THC first"""
+    result_type = str(result_type).lower()
+    if "thc" in result_type:
+        return "thc"
+    if "cbd" in result_type:
+        return "cbd"
+    return None
+
+def _pick_lab_value(values, mask, index, keep="last", default=""):
+    """Select one matching lab value per item and align it to the item index"""
+    picked = values[mask]
+    picked = picked[~picked.index.duplicated(keep=keep)]
+    return picked.reindex(index, fill_value=default)
+
 # Parse Bamboo transfer schema JSON
 def parse_bamboo_data(json_data):
     if not json_data:
@@ -375,35 +751,29 @@ def parse_bamboo_data(json_data):
         
         # Process inventory items
         items = json_data.get("inventory_transfer_items", [])
-        records = []
-        
-        for item in items:
-            # Extract THC and CBD content from lab_result_data if available
-            thc_content = ""
-            cbd_content = ""
-            
-            lab_data = item.get("lab_result_data", {})
-            if lab_data and "potency" in lab_data:
-                for potency_item in lab_data["potency"]:
-                    if potency_item.get("type") == "total-thc":
-                        thc_content = f"{potency_item.get('value', '')}%"
-                    elif potency_item.get("type") == "total-cbd":
-                        cbd_content = f"{potency_item.get('value', '')}%"
-            
-            records.append({
-                "Product Name*": item.get("product_name", ""),
-                "Product Type*": item.get("inventory_type", ""),
-                "Quantity Received*": item.get("qty", ""),
-                "Barcode*": item.get("inventory_id", "") or item.get("external_id", ""),
-                "Accepted Date": accepted_date,
-                "Vendor": vendor_meta,
-                "Strain Name": item.get("strain_name", ""),
-                "THC Content": thc_content,
-                "CBD Content": cbd_content,
-                "Source System": "Bamboo"
-            })
-        
-        return pd.DataFrame(records)
+        if not items:
+            return pd.DataFrame()
+        
+        items_df = pd.DataFrame(items, dtype=object)
+        
+        # Extract THC and CBD content from lab_result_data if available
+        potency = _lab_results(items_df, "lab_result_data", "potency")
+        potency_types = potency.str.get("type")
+        potency_values = potency.str.get("value").fillna("").astype(str) + "%"
+        
+        return pd.DataFrame({
+            "Product Name*": _item_column(items_df, "product_name"),
+            "Product Type*": _item_column(items_df, "inventory_type"),
+            "Quantity Received*": _item_column(items_df, "qty"),
+            "Barcode*": _first_truthy(_item_column(items_df, "inventory_id"),
+                                      _item_column(items_df, "external_id")),
+            "Accepted Date": accepted_date,
+            "Vendor": vendor_meta,
+            "Strain Name": _item_column(items_df, "strain_name"),
+            "THC Content": _pick_lab_value(potency_values, potency_types == "total-thc", items_df.index),
+            "CBD Content": _pick_lab_value(potency_values, potency_types == "total-cbd", items_df.index),
+            "Source System": "Bamboo"
+        }).infer_objects()
     
     except Exception as e:
         raise ValueError(f"Failed to parse Bamboo transfer data: {e}")
@@ -433,38 +803,32 @@ def parse_cultivera_data(json_data):
         
         # Process inventory items
         items = manifest.get("items", [])
-        records = []
-        
-        for item in items:
-            # Extract product info
-            product = item.get("product", {})
-            
-            # Extract THC and CBD content
-            thc_content = ""
-            cbd_content = ""
-            
-            test_results = item.get("test_results", [])
-            if test_results:
-                for result in test_results:
-                    if "thc" in result.get("type", "").lower():
-                        thc_content = f"{result.get('percentage', '')}%"
-                    elif "cbd" in result.get("type", "").lower():
-                        cbd_content = f"{result.get('percentage', '')}%"
-            
-            records.append({
-                "Product Name*": product.get("name", ""),
-                "Product Type*": product.get("category", ""),
-                "Quantity Received*": item.get("quantity", ""),
-                "Barcode*": item.get("barcode", "") or item.get("id", ""),
-                "Accepted Date": accepted_date,
-                "Vendor": vendor_meta,
-                "Strain Name": product.get("strain_name", ""),
-                "THC Content": thc_content,
-                "CBD Content": cbd_content,
-                "Source System": "Cultivera"
-            })
-        
-        return pd.DataFrame(records)
+        if not items:
+            return pd.DataFrame()
+        
+        items_df = pd.DataFrame(items, dtype=object)
+        
+        # Extract THC and CBD content; a result matching "thc" is never counted as CBD
+        results = _lab_results(items_df, "test_results")
+        result_types = results.str.get("type")
+        result_kinds = result_types.map({t: _potency_kind(t) for t in result_types.dropna().unique()})
+        result_values = results.str.get("percentage").fillna("").astype(str) + "%"
+        is_thc = result_kinds == "thc"
+        is_cbd = result_kinds == "cbd"
+        
+        return pd.DataFrame({
+            "Product Name*": _nested_column(items_df, "product", "name"),
+            "Product Type*": _nested_column(items_df, "product", "category"),
+            "Quantity Received*": _item_column(items_df, "quantity"),
+            "Barcode*": _first_truthy(_item_column(items_df, "barcode"),
+                                      _item_column(items_df, "id")),
+            "Accepted Date": accepted_date,
+            "Vendor": vendor_meta,
+            "Strain Name": _nested_column(items_df, "product", "strain_name"),
+            "THC Content": _pick_lab_value(result_values, is_thc, items_df.index),
+            "CBD Content": _pick_lab_value(result_values, is_cbd, items_df.index),
+            "Source System": "Cultivera"
+        }).infer_objects()
     
     except Exception as e:
         raise ValueError(f"Failed to parse Cultivera data: {e}")
@@ -472,15 +836,19 @@ def parse_cultivera_data(json_data):
 # Detect and parse JSON from multiple systems
 def parse_inventory_json(json_data):
     """
-    Detects the JSON format and parses it accordingly
+    Detects the JSON format and parses it accordingly.
+    Accepts parsed JSON, JSON text or bytes, or a readable file-like object.
     """
+    if hasattr(json_data, "read"):
+        json_data = json_data.read()
+    
     if not json_data:
         return None, "No data provided"
     
     try:
-        # If data is a string, parse it to JSON
-        if isinstance(json_data, str):
-            json_data = json.loads(json_data)
+        # If data is raw JSON text or bytes, parse it
+        if isinstance(json_data, (str, bytes)):
+            json_data = json_loads(json_data)
         
         # Try parsing as Bamboo
         if "inventory_transfer_items" in json_data:
@@ -499,6 +867,128 @@ def parse_inventory_json(json_data):
     except Exception as e:
         return None, f"Error parsing data: {str(e)}"
 
+def sort_products(df):
+    """
+    Sort products by type and name, leaving the order alone if that fails.
+    The result has a fresh 0..n-1 index, so rows can be addressed by position.
+    """
+    sort_cols = [col for col in ("Product Type*", "Product Name*") if col in df.columns]
+    if df.empty or not sort_cols:
+        return df
+    try:
+        return df.sort_values(sort_cols, kind="stable", ignore_index=True)
+    except Exception:
+        return df
+
+# JSON text above this size is shown in the import tab as received rather than
+# re-indented, which would make it larger still
+JSON_PRETTY_LIMIT = 2_000_000
+
+def load_json_import(json_data, api_format="auto", pretty=True):
+    """
+    Parses, detects and sorts a JSON import. Runs on a worker thread, so it
+    also pretty-prints the payload for the import tab when pretty is set;
+    JSON text longer than JSON_PRETTY_LIMIT is shown as received instead.
+    Returns (DataFrame or None, format name or error message, formatted JSON or None).
+    """
+    raw_json = None
+    if isinstance(json_data, (str, bytes)):
+        raw_json = json_data
+        try:
+            json_data = json_loads(json_data)
+        except json.JSONDecodeError:
+            return None, "Invalid JSON format. Please check your data.", None
+    
+    if api_format == "bamboo":
+        result_df, format_type = parse_bamboo_data(json_data), "Bamboo"
+    elif api_format == "cultivera":
+        result_df, format_type = parse_cultivera_data(json_data), "Cultivera"
+    else:
+        result_df, format_type = parse_inventory_json(json_data)
+    
+    if result_df is None:
+        return None, format_type, None
+    
+    if not pretty:
+        formatted_json = None
+    elif raw_json is not None and len(raw_json) > JSON_PRETTY_LIMIT:
+        formatted_json = raw_json.decode("utf-8", errors="replace") if isinstance(raw_json, bytes) else raw_json
+    else:
+        formatted_json = json_dumps_pretty(json_data)
+    return sort_products(result_df), format_type, formatted_json
+
+# CSV headers and the column names the app uses for them
+CSV_COLUMN_MAP = {
+    "Product Name*": "Product Name*",
+    "Product Name": "Product Name*",
+    "Quantity Received": "Quantity Received*",
+    "Quantity*": "Quantity Received*",
+    "Quantity": "Quantity Received*",
+    "Lot Number*": "Barcode*",
+    "Barcode": "Barcode*",
+    "Lot Number": "Barcode*",
+    "Accepted Date": "Accepted Date",
+    "Vendor": "Vendor",
+    "Strain Name": "Strain Name",
+    "Product Type*": "Product Type*",
+    "Product Type": "Product Type*",
+    "Inventory Type": "Product Type*"
+}
+
+# Text columns are read as strings, which skips type inference, keeps
+# leading zeros on barcodes and leaves dates as written
+CSV_TEXT_COLUMNS = {
+    name: str for name, column in CSV_COLUMN_MAP.items()
+    if column in ("Product Name*", "Barcode*", "Strain Name", "Product Type*", "Vendor", "Accepted Date")
+}
+
+def read_csv_file(file_path):
+    """
+    Read a CSV into a DataFrame, using pyarrow's multithreaded parser when it
+    is installed. CSV_TEXT_COLUMNS are read as strings either way.
+    """
+    if pacsv is None:
+        return pd.read_csv(file_path, engine="c", dtype=CSV_TEXT_COLUMNS)
+    
+    table = pacsv.read_csv(
+        file_path,
+        convert_options=pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in CSV_TEXT_COLUMNS},
+            strings_can_be_null=True
+        )
+    )
+    return table.to_pandas()
+
+def load_csv_data(file_path):
+    """
+    Read an inventory CSV and map it to the app's columns, filling defaults
+    for missing optional columns. Runs on a worker thread.
+    Returns (DataFrame or None, error message or None).
+    """
+    df = read_csv_file(file_path)
+    stripped = df.columns.astype(str).str.strip()
+    df.columns = [CSV_COLUMN_MAP.get(name, name) for name in stripped]
+    
+    # Ensure required columns exist
+    required_cols = ["Product Name*", "Barcode*"]
+    missing_cols = [col for col in required_cols if col not in df.columns]
+    if missing_cols:
+        return None, f"CSV is missing required columns: {', '.join(missing_cols)}"
+    
+    # Add missing optional columns in one step; blank vendors get the default too
+    defaults = {
+        "Vendor": "Unknown Vendor",
+        "Accepted Date": datetime.date.today().isoformat(),
+        "Product Type*": "Unknown",
+        "Strain Name": ""
+    }
+    missing = {name: value for name, value in defaults.items() if name not in df.columns}
+    if missing:
+        df = df.assign(**missing)
+    df["Vendor"] = df["Vendor"].fillna("Unknown Vendor")
+    
+    return sort_products(df), None
+
 # Main Application Class
 class InventorySlipGenerator:
     def __init__(self, root):
@@ -508,6 +998,13 @@ class InventorySlipGenerator:
         self.colors = ThemeColors(self.theme_name)
         
         self.df = pd.DataFrame()  # Initialize empty DataFrame
+        self.context_menu = None  # Shared text field menu, built on first use
+        self.context_target = None
+        # Imports run as stages: downloads and file reads on io_pool, parsing
+        # on pool, and the product list update back on the Tk thread. Slow
+        # network fetches can't hold up parsing what has already arrived.
+        self.io_pool = ThreadPoolExecutor(max_workers=4)
+        self.pool = ThreadPoolExecutor(max_workers=2)
         
         self.init_ui()
         self.recent_files = self.config['PATHS'].get('recent_files', '').split('|')
@@ -560,6 +1057,11 @@ class InventorySlipGenerator:
         self.style.configure("TFrame",
                              background=self.colors.get("bg_main"))
         
+        # Product list row labels share these styles rather than each
+        # carrying its own font option
+        self.style.configure("ProductInfo.TLabel", font=("Arial", 9))
+        self.style.configure("ProductQty.TLabel", font=("Arial", 10, "bold"))
+        
         # Create menu
         self.create_menu()
         
@@ -794,6 +1296,7 @@ class InventorySlipGenerator:
         
         self.search_var = tk.StringVar()
         self.search_var.trace_add("write", self.on_search)
+        self.search_after_id = None
         
         self.search_entry = tk.Entry(
             filter_frame,
@@ -846,43 +1349,51 @@ class InventorySlipGenerator:
             command=self.canvas.yview
         )
         
-        # Frame inside canvas to hold products
-        self.product_frame = ttk.Frame(self.canvas, style="TFrame")
-        
-        # Configure canvas and scrolling
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        # Configure canvas and scrolling; every view change redraws the rows in view
+        self.canvas.configure(yscrollcommand=self.on_list_scroll)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Create window inside canvas
-        self.canvas_window = self.canvas.create_window(
-            (0, 0),
-            window=self.product_frame,
-            anchor="nw",
-            tags="product_frame"
-        )
-        
-        # Bind events for scrolling and resizing
-        self.product_frame.bind("<Configure>", self.on_frame_configure)
+        # Bind events for resizing
         self.canvas.bind("<Configure>", self.on_canvas_configure)
         
-        # Bind mouse wheel for scrolling
-        self.canvas.bind_all("<MouseWheel>", self.on_mousewheel)
-        self.canvas.bind_all("<Button-4>", self.on_mousewheel)
-        self.canvas.bind_all("<Button-5>", self.on_mousewheel)
-        
-        # Initialize dictionaries for product variables
-        self.product_vars = {}
-        self.group_vars = {}
+        # Bind mouse wheel for scrolling over the list and its rows only
+        add_bindtag(self.canvas, PRODUCT_LIST_BINDTAG)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind_class(PRODUCT_LIST_BINDTAG, sequence, self.on_mousewheel)
+        
+        # Lowercased search text per DataFrame row, and for each list entry its
+        # row position (-1 for group headers) and the entry number of its header
+        self.search_index = np.empty(0, dtype=object)
+        self.entry_positions = np.empty(0, dtype=np.intp)
+        self.entry_headers = np.empty(0, dtype=np.intp)
+        
+        # The last search and which rows it matched; a search that extends it
+        # only needs to check those rows
+        self.last_search = ""
+        self.search_matches = None
+        
+        # Selection state: one flag per DataFrame row (by position), one per
+        # group, and each group's row positions
+        self.selected = np.ones(0, dtype=bool)
+        self.group_selected = {}
+        self.group_positions = {}
+        
+        # All list entries, the entries currently shown (after search) and the row widgets
+        self.product_rows = []
+        self.visible_rows = []
+        self.row_pool = []
+        self.list_width = 0
         
         # Initially display a message when no products are loaded
         self.empty_label = ttk.Label(
-            self.product_frame,
+            self.canvas,
             text="No products loaded. Please load data from CSV or JSON.",
             style="TLabel",
             font=("Arial", 12)
         )
-        self.empty_label.pack(pady=50)
+        add_bindtag(self.empty_label, PRODUCT_LIST_BINDTAG)
+        self.empty_window = self.canvas.create_window(20, 50, window=self.empty_label, anchor="nw")
     
     def create_preview_tab(self):
         # Preview Tab
@@ -998,10 +1509,20 @@ class InventorySlipGenerator:
         self.apply_settings_btn.pack(pady=(0, 10))
     
     def create_bamboo_tab(self):
-        # API Import Tab
+        # API Import Tab; its widgets are built the first time it is shown
         self.bamboo_tab = ttk.Frame(self.notebook, style="TFrame")
         self.notebook.add(self.bamboo_tab, text="API Import")
         
+        self.api_var = tk.StringVar(value="auto")
+        self.json_text = None
+        self.pending_json_text = None
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed, add="+")
+    
+    def on_tab_changed(self, event=None):
+        if self.json_text is None and self.notebook.select() == str(self.bamboo_tab):
+            self.build_bamboo_tab()
+    
+    def build_bamboo_tab(self):
         # Info section
         info_frame = ttk.Frame(self.bamboo_tab, style="TFrame", padding=(10, 10))
         info_frame.pack(fill=tk.X, padx=10, pady=10)
@@ -1026,8 +1547,6 @@ class InventorySlipGenerator:
         api_selection_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
         
         # API selection radiobuttons
-        self.api_var = tk.StringVar(value="auto")
-        
         ttk.Label(
             api_selection_frame,
             text="API Format:",
@@ -1098,22 +1617,35 @@ class InventorySlipGenerator:
         json_frame = ttk.LabelFrame(self.bamboo_tab, text="JSON Data", style="TFrame")
         json_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
         
-        # Scrollbar
+        # Scrollbars
         json_scroll = ttk.Scrollbar(json_frame)
         json_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        json_xscroll = ttk.Scrollbar(json_frame, orient=tk.HORIZONTAL)
+        json_xscroll.pack(side=tk.BOTTOM, fill=tk.X)
         
-        # Text widget for JSON
-        # Text widget for JSON
+        # Text widget for JSON. Manifests can be megabytes, often on a single
+        # line when pasted minified, so lines aren't wrapped and no undo
+        # history is kept.
         self.json_text = tk.Text(
             json_frame,
             font=("Consolas", 10),
             bg=self.colors.get("entry_bg"),
             fg=self.colors.get("entry_fg"),
             insertbackground=self.colors.get("fg_main"),
-            yscrollcommand=json_scroll.set
+            wrap=tk.NONE,
+            undo=False,
+            maxundo=0,
+            yscrollcommand=json_scroll.set,
+            xscrollcommand=json_xscroll.set
         )
         self.json_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         json_scroll.config(command=self.json_text.yview)
+        json_xscroll.config(command=self.json_text.xview)
+        
+        # Show JSON loaded before the tab was built
+        if self.pending_json_text is not None:
+            self.json_text.insert(tk.END, self.pending_json_text)
+            self.pending_json_text = None
         
         # Create context menu for text area
         self.create_context_menu(self.json_text)
@@ -1135,302 +1667,40 @@ class InventorySlipGenerator:
             style="TLabel"
         ).pack(pady=(0, 5))
     
-    def style_product_row(self, row_frame, source_system):
-        """Apply styling to product rows based on their source system"""
-        if source_system == "Bamboo":
-            row_frame.configure(bg=self.colors.get("success"))
-            for child in row_frame.winfo_children():
-                if isinstance(child, ttk.Label):
-                    child.configure(foreground=self.colors.get("success"))
-        elif source_system == "Cultivera":
-            row_frame.configure(bg=self.colors.get("accent"))
-            for child in row_frame.winfo_children():
-                if isinstance(child, ttk.Label):
-                    child.configure(foreground=self.colors.get("accent"))
-    
-    def refresh_product_list(self):
-        # Clear existing product list
-        for widget in self.product_frame.winfo_children():
-            widget.destroy()
-        
-        self.product_vars.clear()
-        self.group_vars.clear()
-        
-        # If no data, show empty message
-        if self.df.empty:
-            self.empty_label = ttk.Label(
-                self.product_frame,
-                text="No products loaded. Please load data from CSV or JSON.",
-                style="TLabel",
-                font=("Arial", 12)
-            )
-            self.empty_label.pack(pady=50)
-            return
-        
-        # Add sources legend
-        if "Source System" in self.df.columns and len(self.df["Source System"].unique()) > 1:
-            legend_frame = ttk.Frame(self.product_frame, style="TFrame")
-            legend_frame.pack(fill=tk.X, pady=(5, 10), padx=5)
-            
-            ttk.Label(
-                legend_frame,
-                text="Data Sources:",
-                style="TLabel",
-                font=("Arial", 10, "bold")
-            ).pack(side=tk.LEFT, padx=(0, 10))
-            
-            for source in sorted(self.df["Source System"].unique()):
-                source_color = self.colors.get("success") if source == "Bamboo" else self.colors.get("accent")
-                
-                source_label = ttk.Label(
-                    legend_frame,
-                    text=source,
-                    style="TLabel",
-                    foreground=source_color,
-                    font=("Arial", 10, "bold")
-                )
-                source_label.pack(side=tk.LEFT, padx=(0, 20))
-        
-        # Group data by product type
-        grouped = self.df.groupby("Product Type*") if "Product Type*" in self.df.columns else {"All Products": self.df}
-        
-        # For each product type, create a group
-        for product_type, group_df in grouped:
-            # Add group select checkbox
-            group_var = tk.BooleanVar(value=True)
-            self.group_vars[product_type] = group_var
-            
-            # Create frame for group header
-            group_frame = ttk.Frame(self.product_frame, style="TFrame")
-            group_frame.pack(fill=tk.X, pady=(10, 5), padx=5)
-            
-            # Group checkbox
-            group_cb = ttk.Checkbutton(
-                group_frame,
-                text=f"Select/Deselect {product_type}",
-                variable=group_var,
-                command=lambda pt=product_type: self.toggle_group(pt),
-                style="TCheckbutton"
-            )
-            group_cb.pack(fill=tk.X, pady=2)
-            
-            # Count items in group
-            count_label = ttk.Label(
-                group_frame,
-                text=f"({len(group_df)} items)",
-                style="TLabel",
-                font=("Arial", 9)
-            )
-            count_label.pack(side=tk.RIGHT, padx=(0, 5))
-            
-            # Add each product under the group
-            for idx, row in group_df.iterrows():
-                product_name = row.get("Product Name*", "")
-                sku = str(row.get("Barcode*", "")).strip()
-                strain_name = row.get("Strain Name", "")
-                source_system = row.get("Source System", "")
-                
-                qty = ""
-                if "Quantity Received*" in row and pd.notna(row["Quantity Received*"]):
-                    qty = row["Quantity Received*"]
-                elif "Quantity*" in row and pd.notna(row["Quantity*"]):
-                    qty = row["Quantity*"]
-                
-                if pd.notna(qty):
-                    try:
-                        qty = int(float(qty))
-                    except (ValueError, TypeError):
-                        qty = str(qty)
-                else:
-                    qty = ""
-                
-                # Create row with product info
-                row_frame = ttk.Frame(self.product_frame, style="TFrame")
-                row_frame.pack(fill=tk.X, pady=2, padx=10)
-                
-                # Store metadata for search functionality
-                row_frame.product_name = product_name
-                row_frame.product_type = product_type
-                row_frame.strain_name = strain_name
-                row_frame.source_system = source_system
-                
-                # Checkbox for selection
-                var = tk.BooleanVar(value=True)
-                cb = ttk.Checkbutton(
-                    row_frame,
-                    text=f"{product_name}",
-                    variable=var,
-                    style="TCheckbutton"
-                )
-                cb.pack(side=tk.LEFT, fill=tk.X, expand=True)
-                
-                # SKU and Quantity labels
-                info_frame = ttk.Frame(row_frame, style="TFrame")
-                info_frame.pack(side=tk.RIGHT)
-                
-                # Source system indicator (small colored square)
-                if source_system:
-                    source_color = self.colors.get("success") if source_system == "Bamboo" else self.colors.get("accent")
-                    source_indicator = ttk.Label(
-                        info_frame,
-                        text=f"• {source_system}",
-                        style="TLabel",
-                        font=("Arial", 9),
-                        foreground=source_color
-                    )
-                    source_indicator.pack(side=tk.TOP, anchor=tk.E)
-                
-                if strain_name:
-                    ttk.Label(
-                        info_frame,
-                        text=f"Strain: {strain_name}",
-                        style="TLabel",
-                        font=("Arial", 9)
-                    ).pack(side=tk.TOP, anchor=tk.E)
-                
-                ttk.Label(
-                    info_frame,
-                    text=f"SKU: {sku}",
-                    style="TLabel",
-                    font=("Arial", 9)
-                ).pack(side=tk.TOP, anchor=tk.E)
-                
-                ttk.Label(
-                    info_frame,
-                    text=f"Qty: {qty}",
-                    style="TLabel",
-                    font=("Arial", 10, "bold")
-                ).pack(side=tk.TOP, anchor=tk.E)
-                
-                # Add THC/CBD content if available
-                thc_content = row.get("THC Content", "")
-                cbd_content = row.get("CBD Content", "")
-                
-                if thc_content or cbd_content:
-                    potency_text = []
-                    if thc_content:
-                        potency_text.append(f"THC: {thc_content}")
-                    if cbd_content:
-                        potency_text.append(f"CBD: {cbd_content}")
-                    
-                    ttk.Label(
-                        info_frame,
-                        text=" | ".join(potency_text),
-                        style="TLabel",
-                        font=("Arial", 9)
-                    ).pack(side=tk.TOP, anchor=tk.E)
-                
-                # Store variable and product type for bulk selection
-                self.product_vars[idx] = (var, product_type)
-    
-    def on_search(self, *args):
-        search_text = self.search_var.get().lower()
-        
-        # Hide all products initially
-        for widget in self.product_frame.winfo_children():
-            if isinstance(widget, ttk.Frame) and hasattr(widget, 'product_type'):
-                widget.pack_forget()
-        
-        # If no search text, show all products
-        if not search_text:
-            for widget in self.product_frame.winfo_children():
-                if isinstance(widget, ttk.Frame) and hasattr(widget, 'product_type'):
-                    widget.pack(fill=tk.X, pady=2, padx=5)
-            return
-        
-        # Show only matching products
-        for widget in self.product_frame.winfo_children():
-            if isinstance(widget, ttk.Frame) and hasattr(widget, 'product_type'):
-                product_name = getattr(widget, 'product_name', '').lower()
-                product_type = getattr(widget, 'product_type', '').lower()
-                strain_name = getattr(widget, 'strain_name', '').lower()
-                source_system = getattr(widget, 'source_system', '').lower()
-                
-                if (search_text in product_name or 
-                    search_text in product_type or 
-                    search_text in strain_name or
-                    search_text in source_system):
-                    widget.pack(fill=tk.X, pady=2, padx=5)
-    
-    def import_bamboo_data(self):
-        # Get JSON data from text area
-        json_data = self.json_text.get(1.0, tk.END)
-        if not json_data.strip():
-            messagebox.showwarning("Warning", "No JSON data to import.")
+    def set_json_text(self, text):
+        """Replace the API Import tab's JSON, keeping it for later if the tab isn't built yet"""
+        if self.json_text is None:
+            self.pending_json_text = text
             return
-        
-        # Get selected API format
-        api_format = self.api_var.get()
-        
-        try:
-            if api_format == "bamboo":
-                # Force Bamboo format
-                data = json.loads(json_data)
-                self.df = parse_bamboo_data(data)
-                format_type = "Bamboo"
-            elif api_format == "cultivera":
-                # Force Cultivera format
-                data = json.loads(json_data)
-                self.df = parse_cultivera_data(data)
-                format_type = "Cultivera"
-            else:
-                # Auto-detect format
-                self.process_json_data(json_data)
-                return
-            
-            # Update UI for specific format
-            self.notebook.tab(2, text=f"{format_type} Import")
-            self.status_var.set(f"{format_type} data imported successfully.")
-            self.progress_var.set(100)
-            
-            # Sort the DataFrame for better organization
-            if not self.df.empty:
-                try:
-                    sort_cols = []
-                    if "Product Type*" in self.df.columns:
-                        sort_cols.append("Product Type*")
-                    if "Product Name*" in self.df.columns:
-                        sort_cols.append("Product Name*")
-                    
-                    if sort_cols:
-                        self.df = self.df.sort_values(sort_cols, ascending=[True, True])
-                except:
-                    pass  # If sorting fails, continue without sorting
-            
-            self.refresh_product_list()
-            
-            # Switch to Data tab
-            self.notebook.select(0)
-            
-            # Reset progress after a delay
-            self.root.after(2000, lambda: self.progress_var.set(0))
-        
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to import data:\n{e}")
-            self.status_var.set("Failed to import data.")
-            self.progress_var.set(0)
+        self.json_text.delete(1.0, tk.END)
+        self.json_text.insert(tk.END, text)
     
     def create_context_menu(self, widget):
-        context_menu = tk.Menu(widget, tearoff=0, bg=self.colors.get("bg_secondary"), fg=self.colors.get("fg_main"))
-        context_menu.add_command(label="Cut", command=lambda: widget.event_generate('<<Cut>>'))
-        context_menu.add_command(label="Copy", command=lambda: widget.event_generate('<<Copy>>'))
-        context_menu.add_command(label="Paste", command=lambda: widget.event_generate('<<Paste>>'))
-        context_menu.add_separator()
-        context_menu.add_command(label="Select All", command=lambda: widget.event_generate('<<SelectAll>>'))
-        
-        if isinstance(widget, tk.Text):
-            context_menu.add_separator()
-            context_menu.add_command(label="Format JSON", command=lambda: self.format_json_text(widget))
-        
-        def show_context_menu(event):
-            try:
-                context_menu.tk_popup(event.x_root, event.y_root)
-            finally:
-                context_menu.grab_release()
-        
-        widget.bind("<Button-3>", show_context_menu)  # Right-click on Windows/Linux
+        # One menu is shared by every text field and acts on the widget it
+        # was opened from
+        if self.context_menu is None:
+            self.context_menu = tk.Menu(self.root, tearoff=0, bg=self.colors.get("bg_secondary"), fg=self.colors.get("fg_main"))
+            for label, event in (("Cut", "<<Cut>>"), ("Copy", "<<Copy>>"), ("Paste", "<<Paste>>")):
+                self.context_menu.add_command(label=label, command=lambda event=event: self.context_target.event_generate(event))
+            self.context_menu.add_separator()
+            self.context_menu.add_command(label="Select All", command=lambda: self.context_target.event_generate('<<SelectAll>>'))
+            self.context_menu.add_separator()
+            self.context_menu.add_command(label="Format JSON", command=lambda: self.format_json_text(self.context_target))
+        
+        widget.bind("<Button-3>", self.show_context_menu)  # Right-click on Windows/Linux
         if sys.platform == 'darwin':
-            widget.bind("<Button-2>", show_context_menu)  # Right-click on macOS
+            widget.bind("<Button-2>", self.show_context_menu)  # Right-click on macOS
+    
+    def show_context_menu(self, event):
+        self.context_target = event.widget
+        self.context_menu.entryconfigure(
+            "Format JSON",
+            state=tk.NORMAL if isinstance(event.widget, tk.Text) else tk.DISABLED
+        )
+        try:
+            self.context_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            self.context_menu.grab_release()
     
     def format_json_text(self, text_widget):
         """Format the JSON in a text widget for better readability"""
@@ -1439,8 +1709,8 @@ class InventorySlipGenerator:
             if not content.strip():
                 return
             
-            parsed = json.loads(content)
-            formatted = json.dumps(parsed, indent=2)
+            parsed = json_loads(content)
+            formatted = json_dumps_pretty(parsed)
             
             text_widget.delete(1.0, tk.END)
             text_widget.insert(tk.END, formatted)
@@ -1451,50 +1721,6 @@ class InventorySlipGenerator:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to format JSON:\n{e}")
     
-    def on_frame_configure(self, event=None):
-        # Update the scrollregion to encompass the inner frame
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-    
-    def on_canvas_configure(self, event=None):
-        # When the canvas is resized, also resize the inner frame
-        width = event.width
-        self.canvas.itemconfig(self.canvas_window, width=width)
-    
-    def on_mousewheel(self, event):
-        # Respond to mouse wheel events for scrolling
-        if sys.platform == 'darwin':
-            self.canvas.yview_scroll(-1 * event.delta, "units")
-        else:
-            if hasattr(event, 'num'):
-                if event.num == 4:
-                    self.canvas.yview_scroll(-1, "units")
-                elif event.num == 5:
-                    self.canvas.yview_scroll(1, "units")
-            else:
-                self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-    
-    def toggle_all(self):
-        select = self.select_all_var.get()
-        
-        # First: toggle all individual product checkboxes
-        for var, _ in self.product_vars.values():
-            var.set(select)
-        
-        # Then: toggle all group (product type) checkboxes
-        for group_var in self.group_vars.values():
-            group_var.set(select)
-    
-    def toggle_group(self, product_type):
-        group_select = self.group_vars.get(product_type)
-        if group_select is None:
-            return
-        
-        select = group_select.get()
-        
-        for idx, (var, ptype) in self.product_vars.items():
-            if ptype == product_type:
-                var.set(select)
-    
     def show_api_fetch_dialog(self):
         api_dialog = tk.Toplevel(self.root)
         api_dialog.title("Fetch from API")
@@ -1616,130 +1842,88 @@ class InventorySlipGenerator:
         if api_key:
             headers["Authorization"] = f"Bearer {api_key}"
         
-        def fetch_data():
-            try:
-                req = urllib.request.Request(url, headers=headers)
-                with urllib.request.urlopen(req) as resp:
-                    data = json.loads(resp.read().decode())
-                
-                # Process data based on format
-                self.root.after(0, lambda: self.process_api_data(data, api_type))
-                
-                # Add to recent URLs if not already there
-                if url not in self.recent_urls:
-                    self.recent_urls.insert(0, url)
-                    self.recent_urls = self.recent_urls[:10]  # Keep only 10 most recent
-                    self.config['PATHS']['recent_urls'] = '|'.join(self.recent_urls)
-                    save_config(self.config)
-                    self.update_recent_menu()
-            
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to fetch API data:\n{e}"))
-                self.root.after(0, lambda: self.status_var.set("Failed to fetch data."))
-                self.root.after(0, lambda: self.progress_var.set(0))
-        
-        # Run in a separate thread to prevent UI freezing
-        threading.Thread(target=fetch_data, daemon=True).start()
+        # Download on the I/O pool; the JSON is parsed by process_json_data
+        future = self.io_pool.submit(fetch_url, url, headers, True)
+        future.add_done_callback(lambda f: self.root.after(0, self.finish_url_fetch, url, f, None, api_type))
     
-    def process_api_data(self, data, api_type="auto"):
-        self.status_var.set("Processing API data...")
-        self.progress_var.set(30)
-        
+    def finish_url_fetch(self, url, future, dialog=None, api_format="auto"):
         try:
-            # Process based on specified API type
-            if api_type == "bamboo":
-                result_df = parse_bamboo_data(data)
-                format_type = "Bamboo"
-            elif api_type == "cultivera":
-                result_df = parse_cultivera_data(data)
-                format_type = "Cultivera"
-            else:  # auto-detect
-                result_df, format_type = parse_inventory_json(data)
-            
-            if result_df is None or result_df.empty:
-                messagebox.showerror("Error", f"Could not process {api_type} data.")
-                self.status_var.set("Failed to process data.")
-                self.progress_var.set(0)
-                return
-            
-            # Success
-            self.df = result_df
-            
-            # Update JSON text area
-            self.json_text.delete(1.0, tk.END)
-            self.json_text.insert(tk.END, json.dumps(data, indent=2))
-            
-            # Update tab name to reflect the format
-            self.notebook.tab(2, text=f"{format_type} Import")
-            
-            # Sort the DataFrame for better organization
-            if not self.df.empty:
-                try:
-                    sort_cols = []
-                    if "Product Type*" in self.df.columns:
-                        sort_cols.append("Product Type*")
-                    if "Product Name*" in self.df.columns:
-                        sort_cols.append("Product Name*")
-                    
-                    if sort_cols:
-                        self.df = self.df.sort_values(sort_cols, ascending=[True, True])
-                except:
-                    pass  # If sorting fails, continue without sorting
-            
-            self.refresh_product_list()
-            self.status_var.set(f"{format_type} data processed successfully.")
-            self.progress_var.set(100)
-            
-            # Switch to Data tab
-            self.notebook.select(0)
-            
-            # Reset progress after a delay
-            self.root.after(2000, lambda: self.progress_var.set(0))
-        
+            data = future.result()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to process API data:\n{e}")
-            self.status_var.set("Failed to process data.")
-            self.progress_var.set(0) (padx=5, pady=5)
-        json_scroll.config(command=self.json_text.yview)
+            messagebox.showerror("Error", f"Failed to fetch JSON:\n{e}")
+            self.status_var.set("Failed to fetch data.")
+            self.progress_var.set(0)
+            return
         
-        # Create context menu for text area
-        self.create_context_menu(self.json_text)
+        self.add_recent("recent_urls", url)
         
-        # Import button
-        self.import_json_btn = ttk.Button(
-            self.bamboo_tab,
-            text="Import Bamboo Data",
-            command=self.import_bamboo_data,
-            style="TButton"
-        )
-        self.import_json_btn.pack(pady=(0, 10))
+        self.process_json_data(data, dialog, api_format)
     
-    def create_context_menu(self, widget):
-        context_menu = tk.Menu(widget, tearoff=0, bg=self.colors.get("bg_secondary"), fg=self.colors.get("fg_main"))
-        context_menu.add_command(label="Cut", command=lambda: widget.event_generate('<<Cut>>'))
-        context_menu.add_command(label="Copy", command=lambda: widget.event_generate('<<Copy>>'))
-        context_menu.add_command(label="Paste", command=lambda: widget.event_generate('<<Paste>>'))
-        context_menu.add_separator()
-        context_menu.add_command(label="Select All", command=lambda: widget.event_generate('<<SelectAll>>'))
-        
-        def show_context_menu(event):
-            try:
-                context_menu.tk_popup(event.x_root, event.y_root)
-            finally:
-                context_menu.grab_release()
+    def on_canvas_configure(self, event=None):
+        # When the canvas is resized, make sure enough rows exist to fill it.
+        # Rows already drawn only need redrawing when the width changes.
+        needed = self.canvas.winfo_height() // PRODUCT_ROW_HEIGHT + 2
+        while len(self.row_pool) < needed:
+            self.row_pool.append(ProductListRow(self.canvas, self.on_row_toggled))
+        
+        width = self.canvas.winfo_width()
+        width_changed = width != self.list_width
+        self.list_width = width
+        
+        self.update_scrollregion()
+        self.render_visible_rows(force=width_changed)
+    
+    def on_list_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.render_visible_rows()
+    
+    def update_scrollregion(self):
+        height = len(self.visible_rows) * PRODUCT_ROW_HEIGHT
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), height))
+    
+    def show_product_rows(self, rows):
+        """Replace the entries shown in the product list and scroll back to the top"""
+        self.visible_rows = rows
+        self.canvas.itemconfig(self.empty_window, state="hidden" if self.product_rows else "normal")
+        self.update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self.render_visible_rows(force=True)
+    
+    def render_visible_rows(self, force=False):
+        """Draw the entries in view; a row keeps its entry while it stays in view"""
+        if not self.row_pool:
+            return
         
-        widget.bind("<Button-3>", show_context_menu)  # Right-click on Windows/Linux
-        if sys.platform == 'darwin':
-            widget.bind("<Button-2>", show_context_menu)  # Right-click on macOS
-    
-    def on_frame_configure(self, event=None):
-        # Update the scrollregion to encompass the inner frame
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        pool_size = len(self.row_pool)
+        top = int(self.canvas.canvasy(0)) // PRODUCT_ROW_HEIGHT
+        width = self.canvas.winfo_width()
+        
+        for position in range(top, top + pool_size):
+            row = self.row_pool[position % pool_size]
+            if position >= len(self.visible_rows):
+                if row.position is not None:
+                    row.hide()
+                continue
+            if row.position == position and not force:
+                continue
+            
+            entry = self.visible_rows[position]
+            if entry[0] == "group":
+                selected = self.group_selected[entry[1]]
+            else:
+                selected = bool(self.selected[entry[1]])
+            row.show(position, entry, selected, width)
     
-    def on_canvas_configure(self, event=None):
-        # When the canvas is resized, also resize the inner frame
-        width = event.width
-        self.canvas.itemconfig(self.canvas_window, width=width)
+    def on_row_toggled(self, row):
+        # Copy the row's checkbox into the selection state; group headers
+        # also apply it to all of the group's products
+        if row.entry is None:
+            return
+        if row.entry[0] == "group":
+            self.group_selected[row.entry[1]] = row.var.get()
+            self.toggle_group(row.entry[1])
+        else:
+            self.selected[row.entry[1]] = row.var.get()
     
     def on_mousewheel(self, event):
         # Respond to mouse wheel events for scrolling
@@ -1756,51 +1940,59 @@ class InventorySlipGenerator:
     def toggle_all(self):
         select = self.select_all_var.get()
         
-        # First: toggle all individual product checkboxes
-        for var, _ in self.product_vars.values():
-            var.set(select)
-        
-        # Then: toggle all group (product type) checkboxes
-        for group_var in self.group_vars.values():
-            group_var.set(select)
+        # Set every product and group at once, then redraw the rows in view
+        self.selected[:] = select
+        for product_type in self.group_selected:
+            self.group_selected[product_type] = select
+        self.render_visible_rows(force=True)
     
     def toggle_group(self, product_type):
-        group_select = self.group_vars.get(product_type)
-        if group_select is None:
+        positions = self.group_positions.get(product_type)
+        if positions is None:
             return
         
-        select = group_select.get()
-        
-        for idx, (var, ptype) in self.product_vars.items():
-            if ptype == product_type:
-                var.set(select)
+        self.selected[positions] = self.group_selected[product_type]
+        self.render_visible_rows(force=True)
     
     def on_search(self, *args):
+        # Filter once typing pauses rather than on every keystroke
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+        self.search_after_id = self.root.after(SEARCH_DELAY_MS, self.apply_search)
+    
+    def apply_search(self):
+        self.search_after_id = None
         search_text = self.search_var.get().lower()
         
-        # Hide all products initially
-        for widget in self.product_frame.winfo_children():
-            if isinstance(widget, tk.Frame) and hasattr(widget, 'product_type'):
-                widget.pack_forget()
-        
         # If no search text, show all products
         if not search_text:
-            for widget in self.product_frame.winfo_children():
-                if isinstance(widget, tk.Frame) and hasattr(widget, 'product_type'):
-                    widget.pack(fill=tk.X, pady=2, padx=5)
+            self.last_search = ""
+            self.show_product_rows(self.product_rows)
             return
         
-        # Show only matching products
-        for widget in self.product_frame.winfo_children():
-            if isinstance(widget, tk.Frame) and hasattr(widget, 'product_type'):
-                product_name = getattr(widget, 'product_name', '').lower()
-                product_type = getattr(widget, 'product_type', '').lower()
-                strain_name = getattr(widget, 'strain_name', '').lower()
-                
-                if (search_text in product_name or 
-                    search_text in product_type or 
-                    search_text in strain_name):
-                    widget.pack(fill=tk.X, pady=2, padx=5)
+        # Match products at once, then keep matching entries under their group
+        # header. Typing more of the same search can only narrow the matches.
+        if self.last_search and search_text.startswith(self.last_search):
+            candidates = np.flatnonzero(self.search_matches)
+        else:
+            candidates = np.arange(len(self.search_index))
+        matches = np.zeros(len(self.search_index), dtype=bool)
+        matches[candidates] = np.fromiter(
+            (search_text in key for key in self.search_index[candidates]),
+            dtype=bool,
+            count=len(candidates)
+        )
+        self.last_search = search_text
+        self.search_matches = matches
+        
+        is_product = self.entry_positions >= 0
+        entry_matches = np.zeros(len(self.product_rows), dtype=bool)
+        entry_matches[is_product] = matches[self.entry_positions[is_product]]
+        
+        # Headers come before their products, so marking them keeps the list order
+        shown = entry_matches.copy()
+        shown[self.entry_headers[entry_matches]] = True
+        self.show_product_rows([self.product_rows[entry_num] for entry_num in np.flatnonzero(shown).tolist()])
     
     def show_find_dialog(self):
         find_dialog = tk.Toplevel(self.root)
@@ -2087,95 +2279,55 @@ class InventorySlipGenerator:
         self.status_var.set(f"Loading data from {url}...")
         self.progress_var.set(10)
         
-        def fetch_data():
-            try:
-                with urllib.request.urlopen(url) as resp:
-                    data = json.loads(resp.read().decode())
-                
-                self.root.after(0, lambda: self.process_json_data(data, dialog))
-                
-                # Add to recent URLs if not already there
-                if url not in self.recent_urls:
-                    self.recent_urls.insert(0, url)
-                    self.recent_urls = self.recent_urls[:10]  # Keep only 10 most recent
-                    self.config['PATHS']['recent_urls'] = '|'.join(self.recent_urls)
-                    save_config(self.config)
-                    self.update_recent_menu()
-            
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to fetch JSON:\n{e}"))
-                self.root.after(0, lambda: self.status_var.set("Failed to load data."))
-                self.root.after(0, lambda: self.progress_var.set(0))
-        
-        # Run in a separate thread to prevent UI freezing
-        threading.Thread(target=fetch_data, daemon=True).start()
+        future = self.io_pool.submit(fetch_url, url, None, True)
+        future.add_done_callback(lambda f: self.root.after(0, self.finish_url_fetch, url, f, dialog))
     
-    def process_json_data(self, data, dialog=None):
+    def process_json_data(self, data, dialog=None, api_format="auto", show_json=True):
         if dialog:
             dialog.destroy()
         
         self.status_var.set("Processing JSON data...")
         self.progress_var.set(30)
         
+        # Parse and sort on a worker thread so large manifests don't freeze the UI
+        future = self.pool.submit(load_json_import, data, api_format, show_json)
+        future.add_done_callback(lambda f: self.root.after(0, self.finish_json_import, f))
+    
+    def finish_json_import(self, future):
         try:
-            # If data is a string, parse it
-            if isinstance(data, str):
-                try:
-                    data = json.loads(data)
-                except json.JSONDecodeError:
-                    messagebox.showerror("Error", "Invalid JSON format. Please check your data.")
-                    self.status_var.set("Failed to process data.")
-                    self.progress_var.set(0)
-                    return
-            
-            # Detect and parse the format
-            result_df, format_type = parse_inventory_json(data)
-            
-            if result_df is None:
-                messagebox.showerror("Error", f"Could not parse data: {format_type}")
-                self.status_var.set("Failed to process data.")
-                self.progress_var.set(0)
-                return
-            
-            # Success
-            self.df = result_df
-            
-            # Update JSON text area
-            if format_type in ["Bamboo", "Cultivera"]:
-                self.json_text.delete(1.0, tk.END)
-                self.json_text.insert(tk.END, json.dumps(data, indent=2))
-                
-                # Update tab name to reflect the format
-                self.notebook.tab(2, text=f"{format_type} Import")
-            
-            # Sort the DataFrame for better organization
-            if not self.df.empty:
-                try:
-                    sort_cols = []
-                    if "Product Type*" in self.df.columns:
-                        sort_cols.append("Product Type*")
-                    if "Product Name*" in self.df.columns:
-                        sort_cols.append("Product Name*")
-                    
-                    if sort_cols:
-                        self.df = self.df.sort_values(sort_cols, ascending=[True, True])
-                except:
-                    pass  # If sorting fails, continue without sorting
-            
-            self.refresh_product_list()
-            self.status_var.set(f"{format_type} data processed successfully.")
-            self.progress_var.set(100)
-            
-            # Switch to Data tab
-            self.notebook.select(0)
-            
-            # Reset progress after a delay
-            self.root.after(2000, lambda: self.progress_var.set(0))
-        
+            result_df, format_type, formatted_json = future.result()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to process data:\n{e}")
             self.status_var.set("Failed to process data.")
             self.progress_var.set(0)
+            return
+        
+        if result_df is None:
+            messagebox.showerror("Error", f"Could not parse data: {format_type}")
+            self.status_var.set("Failed to process data.")
+            self.progress_var.set(0)
+            return
+        
+        # Success
+        self.df = result_df
+        
+        # Update JSON text area
+        if format_type in ["Bamboo", "Cultivera"]:
+            if formatted_json is not None:
+                self.set_json_text(formatted_json)
+            
+            # Update tab name to reflect the format
+            self.notebook.tab(2, text=f"{format_type} Import")
+        
+        self.refresh_product_list()
+        self.status_var.set(f"{format_type} data processed successfully.")
+        self.progress_var.set(100)
+        
+        # Switch to Data tab
+        self.notebook.select(0)
+        
+        # Reset progress after a delay
+        self.root.after(2000, lambda: self.progress_var.set(0))
     
     def load_csv(self):
         file_path = filedialog.askopenfilename(filetypes=[("CSV Files", "*.csv")])
@@ -2188,106 +2340,35 @@ class InventorySlipGenerator:
         self.status_var.set(f"Loading data from {os.path.basename(file_path)}...")
         self.progress_var.set(10)
         
-        def load_data():
-            try:
-                df = pd.read_csv(file_path)
-                
-                # Add to recent files if not already there
-                if file_path not in self.recent_files:
-                    self.recent_files.insert(0, file_path)
-                    self.recent_files = self.recent_files[:10]  # Keep only 10 most recent
-                    self.config['PATHS']['recent_files'] = '|'.join(self.recent_files)
-                    save_config(self.config)
-                    self.update_recent_menu()
-                
-                self.root.after(0, lambda: self.process_csv_data(df))
-            
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to load CSV:\n{e}"))
-                self.root.after(0, lambda: self.status_var.set("Failed to load data."))
-                self.root.after(0, lambda: self.progress_var.set(0))
-        
-        # Run in a separate thread to prevent UI freezing
-        threading.Thread(target=load_data, daemon=True).start()
+        # Read, normalize and sort on a worker thread to prevent UI freezing
+        future = self.pool.submit(load_csv_data, file_path)
+        future.add_done_callback(lambda f: self.root.after(0, self.finish_csv_load, file_path, f))
     
-    def process_csv_data(self, df):
-        self.status_var.set("Processing CSV data...")
-        self.progress_var.set(50)
-        
+    def finish_csv_load(self, file_path, future):
         try:
-            # Map column names to expected format
-            col_map = {
-                "Product Name*": "Product Name*",
-                "Product Name": "Product Name*",
-                "Quantity Received": "Quantity Received*",
-                "Quantity*": "Quantity Received*",
-                "Quantity": "Quantity Received*",
-                "Lot Number*": "Barcode*",
-                "Barcode": "Barcode*",
-                "Lot Number": "Barcode*",
-                "Accepted Date": "Accepted Date",
-                "Vendor": "Vendor",
-                "Strain Name": "Strain Name",
-                "Product Type*": "Product Type*",
-                "Product Type": "Product Type*",
-                "Inventory Type": "Product Type*"
-            }
-            
-            df = df.rename(columns=lambda x: col_map.get(x.strip(), x.strip()))
-            
-            # Ensure required columns exist
-            required_cols = ["Product Name*", "Barcode*"]
-            missing_cols = [col for col in required_cols if col not in df.columns]
-            
-            if missing_cols:
-                messagebox.showerror("Error", f"CSV is missing required columns: {', '.join(missing_cols)}")
-                self.status_var.set("Failed to process data.")
-                self.progress_var.set(0)
-                return
-            
-            # Set default values for missing columns
-            if "Vendor" not in df.columns:
-                df["Vendor"] = "Unknown Vendor"
-            else:
-                df["Vendor"] = df["Vendor"].fillna("Unknown Vendor")
-            
-            if "Accepted Date" not in df.columns:
-                today = datetime.datetime.today().strftime("%Y-%m-%d")
-                df["Accepted Date"] = today
-            
-            if "Product Type*" not in df.columns:
-                df["Product Type*"] = "Unknown"
-            
-            if "Strain Name" not in df.columns:
-                df["Strain Name"] = ""
-            
-            # Store the DataFrame
-            self.df = df
-            
-            # Sort if possible
-            try:
-                sort_cols = []
-                if "Product Type*" in self.df.columns:
-                    sort_cols.append("Product Type*")
-                if "Product Name*" in self.df.columns:
-                    sort_cols.append("Product Name*")
-                
-                if sort_cols:
-                    self.df = self.df.sort_values(sort_cols, ascending=[True, True])
-            except:
-                pass  # If sorting fails, continue without sorting
-            
-            self.refresh_product_list()
-            self.status_var.set("CSV data processed successfully.")
-            self.progress_var.set(100)
-            
-            # Reset progress after a delay
-            self.root.after(2000, lambda: self.progress_var.set(0))
-        
+            df, message = future.result()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to process CSV data:\n{e}")
+            messagebox.showerror("Error", f"Failed to load CSV:\n{e}")
+            self.status_var.set("Failed to load data.")
+            self.progress_var.set(0)
+            return
+        
+        self.add_recent("recent_files", file_path)
+        
+        if df is None:
+            messagebox.showerror("Error", message)
             self.status_var.set("Failed to process data.")
             self.progress_var.set(0)
+            return
+        
+        # Store the DataFrame
+        self.df = df
+        self.refresh_product_list()
+        self.status_var.set("CSV data processed successfully.")
+        self.progress_var.set(100)
+        
+        # Reset progress after a delay
+        self.root.after(2000, lambda: self.progress_var.set(0))
     
     def load_bamboo_file(self):
         file_path = filedialog.askopenfilename(filetypes=[("JSON Files", "*.json")])
@@ -2297,33 +2378,40 @@ class InventorySlipGenerator:
         self.status_var.set(f"Loading Bamboo data from {os.path.basename(file_path)}...")
         self.progress_var.set(10)
         
-        def load_data():
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                
-                # Add to recent files if not already there
-                if file_path not in self.recent_files:
-                    self.recent_files.insert(0, file_path)
-                    self.recent_files = self.recent_files[:10]  # Keep only 10 most recent
-                    self.config['PATHS']['recent_files'] = '|'.join(self.recent_files)
-                    save_config(self.config)
-                    self.update_recent_menu()
-                
-                # Update JSON text area
-                self.root.after(0, lambda: self.json_text.delete(1.0, tk.END))
-                self.root.after(0, lambda: self.json_text.insert(tk.END, json.dumps(data, indent=2)))
-                
-                # Process the data
-                self.root.after(0, lambda: self.process_json_data(data))
-            
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to load JSON file:\n{e}"))
-                self.root.after(0, lambda: self.status_var.set("Failed to load data."))
-                self.root.after(0, lambda: self.progress_var.set(0))
+        def read_file():
+            with open(file_path, 'rb') as f:
+                return f.read()
+        
+        # Read on the I/O pool rather than a thread per load
+        future = self.io_pool.submit(read_file)
+        future.add_done_callback(lambda f: self.root.after(0, self.finish_file_load, file_path, f))
+    
+    def add_recent(self, name, item):
+        """Move item to the front of recent_files or recent_urls (name) and save the list"""
+        recent = getattr(self, name)
+        if recent and recent[0] == item:
+            return
+        
+        recent = [item] + [entry for entry in recent if entry != item]
+        recent = recent[:10]  # Keep only 10 most recent
+        setattr(self, name, recent)
+        self.config['PATHS'][name] = '|'.join(recent)
+        save_config(self.config)
+        self.update_recent_menu()
+    
+    def finish_file_load(self, file_path, future):
+        try:
+            data = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load JSON file:\n{e}")
+            self.status_var.set("Failed to load data.")
+            self.progress_var.set(0)
+            return
+        
+        self.add_recent("recent_files", file_path)
         
-        # Run in a separate thread to prevent UI freezing
-        threading.Thread(target=load_data, daemon=True).start()
+        # Parse once on the worker, which also fills the JSON text area
+        self.process_json_data(data)
     
     def import_bamboo_data(self):
         # Get JSON data from text area
@@ -2332,10 +2420,8 @@ class InventorySlipGenerator:
             messagebox.showwarning("Warning", "No JSON data to import.")
             return
         
-        try:
-            self.process_json_data(json_data)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to import Bamboo data:\n{e}")
+        # The text area already holds this JSON, so don't write it back
+        self.process_json_data(json_data, api_format=self.api_var.get(), show_json=False)
     
     def clear_json_data(self):
         self.json_text.delete(1.0, tk.END)
@@ -2351,124 +2437,94 @@ class InventorySlipGenerator:
                              "Theme changes will be fully applied after restarting the application.")
     
     def refresh_product_list(self):
-        # Clear existing product list
-        for widget in self.product_frame.winfo_children():
-            widget.destroy()
-        
-        self.product_vars.clear()
-        self.group_vars.clear()
+        # Rebuild the list entries; only the rows in view become widgets
+        self.selected = np.zeros(len(self.df), dtype=bool)
+        self.group_selected = {}
+        self.group_positions = {}
+        self.product_rows = []
+        self.last_search = ""
+        entry_positions = []
+        entry_headers = []
         
         # If no data, show empty message
         if self.df.empty:
-            self.empty_label = ttk.Label(
-                self.product_frame,
-                text="No products loaded. Please load data from CSV or JSON.",
-                style="TLabel",
-                font=("Arial", 12)
-            )
-            self.empty_label.pack(pady=50)
+            self.search_index = np.empty(0, dtype=object)
+            self.entry_positions = np.empty(0, dtype=np.intp)
+            self.entry_headers = np.empty(0, dtype=np.intp)
+            self.apply_search()
             return
         
-        # Group data by product type
-        grouped = self.df.groupby("Product Type*") if "Product Type*" in self.df.columns else {"All Products": self.df}
+        # Rows are addressed by position so selection maps straight onto self.df;
+        # sorted imports already have a positional index
+        df = self.df
+        if not df.index.equals(pd.RangeIndex(len(df))):
+            df = df.reset_index(drop=True)
         
-        # For each product type, create a group
-        for product_type, group_df in grouped:
-            # Add group select checkbox
-            group_var = tk.BooleanVar(value=True)
-            self.group_vars[product_type] = group_var
-            
-            # Create frame for group header
-            group_frame = ttk.Frame(self.product_frame, style="TFrame")
-            group_frame.pack(fill=tk.X, pady=(10, 5), padx=5)
-            
-            # Group checkbox
-            group_cb = ttk.Checkbutton(
-                group_frame,
-                text=f"Select/Deselect {product_type}",
-                variable=group_var,
-                command=lambda pt=product_type: self.toggle_group(pt),
-                style="TCheckbutton"
-            )
-            group_cb.pack(fill=tk.X, pady=2)
-            
-            # Add each product under the group
-            for idx, row in group_df.iterrows():
-                product_name = row.get("Product Name*", "")
-                sku = str(row.get("Barcode*", "")).strip()
-                strain_name = row.get("Strain Name", "")
-                
-                qty = ""
-                if "Quantity Received*" in row and pd.notna(row["Quantity Received*"]):
-                    qty = row["Quantity Received*"]
-                elif "Quantity*" in row and pd.notna(row["Quantity*"]):
-                    qty = row["Quantity*"]
-                
-                if pd.notna(qty):
-                    try:
-                        qty = int(float(qty))
-                    except (ValueError, TypeError):
-                        qty = str(qty)
-                else:
-                    qty = ""
-                
-                # Create row with product info
-                row_frame = ttk.Frame(self.product_frame, style="TFrame")
-                row_frame.pack(fill=tk.X, pady=2, padx=10)
-                
-                # Store metadata for search functionality
-                row_frame.product_name = product_name
-                row_frame.product_type = product_type
-                row_frame.strain_name = strain_name
-                
-                # Checkbox for selection
-                var = tk.BooleanVar(value=True)
-                cb = ttk.Checkbutton(
-                    row_frame,
-                    text=f"{product_name}",
-                    variable=var,
-                    style="TCheckbutton"
-                )
-                cb.pack(side=tk.LEFT, fill=tk.X, expand=True)
-                
-                # SKU and Quantity labels
-                info_frame = ttk.Frame(row_frame, style="TFrame")
-                info_frame.pack(side=tk.RIGHT)
-                
-                if strain_name:
-                    ttk.Label(
-                        info_frame,
-                        text=f"Strain: {strain_name}",
-                        style="TLabel",
-                        font=("Arial", 9)
-                    ).pack(side=tk.TOP, anchor=tk.E)
-                
-                ttk.Label(
-                    info_frame,
-                    text=f"SKU: {sku}",
-                    style="TLabel",
-                    font=("Arial", 9)
-                ).pack(side=tk.TOP, anchor=tk.E)
-                
-                ttk.Label(
-                    info_frame,
-                    text=f"Qty: {qty}",
-                    style="TLabel",
-                    font=("Arial", 10, "bold")
-                ).pack(side=tk.TOP, anchor=tk.E)
-                
-                # Store variable and product type for bulk selection
-                self.product_vars[idx] = (var, product_type)
+        if "Product Type*" in df.columns:
+            product_types = df["Product Type*"].to_numpy()
+        else:
+            product_types = np.full(len(df), "All Products", dtype=object)
+        
+        # Searchable text per row; the separator keeps matches within one field
+        def text_column(name):
+            if name in df.columns:
+                return df[name].fillna("").astype(str)
+            return pd.Series("", index=df.index)
+        
+        product_names = text_column("Product Name*")
+        strain_names = text_column("Strain Name")
+        search_index = (product_names + "\x1f" +
+                        pd.Series(product_types, index=df.index).fillna("").astype(str) + "\x1f" +
+                        strain_names)
+        self.search_index = search_index.str.lower().to_numpy(dtype=object)
+        
+        product_names = product_names.to_numpy()
+        strain_names = strain_names.to_numpy()
+        skus = text_column("Barcode*").str.strip().to_numpy()
+        quantities = display_quantities(df)
+        
+        # Group rows by product type like groupby would (sorted, missing types
+        # left out) by stable-sorting the type codes once
+        type_codes, group_types = pd.factorize(product_types, sort=True)
+        order = np.argsort(type_codes, kind="stable")
+        sorted_codes = type_codes[order]
+        group_codes = np.arange(len(group_types))
+        starts = np.searchsorted(sorted_codes, group_codes, side="left")
+        ends = np.searchsorted(sorted_codes, group_codes, side="right")
+        self.selected[type_codes >= 0] = True
+        
+        # For each product type, add a group header followed by its products;
+        # a group's rows are a slice of the sorted order
+        for code, product_type in enumerate(group_types):
+            positions = order[starts[code]:ends[code]]
+            count = len(positions)
+            self.group_selected[product_type] = True
+            self.group_positions[product_type] = positions
+            header = len(self.product_rows)
+            self.product_rows.append(("group", product_type))
+            entry_positions.append(-1)
+            entry_headers.append(header)
+            
+            self.product_rows.extend(zip(
+                repeat("product", count), positions.tolist(), repeat(product_type, count),
+                product_names[positions], strain_names[positions], skus[positions], quantities[positions]
+            ))
+            entry_positions.extend(positions.tolist())
+            entry_headers.extend(repeat(header, count))
+        
+        self.entry_positions = np.array(entry_positions, dtype=np.intp)
+        self.entry_headers = np.array(entry_headers, dtype=np.intp)
+        self.apply_search()
     
     def on_generate(self):
         # Get selected products
-        sel_idxs = [i for i, (var, _) in self.product_vars.items() if var.get()]
+        sel_positions = np.flatnonzero(self.selected)
         
-        if not sel_idxs:
+        if not len(sel_positions):
             messagebox.showerror("Error", "No products selected.")
             return
         
-        selected_df = self.df.loc[sel_idxs].copy()
+        selected_df = self.df.iloc[sel_positions].copy()
         
         # Get latest settings from UI
         self.config['PATHS']['output_dir'] = self.output_dir_var.get()
@@ -2490,83 +2546,66 @@ class InventorySlipGenerator:
                 lambda val: self.root.after(0, lambda: self.progress_var.set(val))
             )
             
-            if success:
-                self.root.after(0, lambda: messagebox.showinfo("Success", f"Inventory slips saved to:\n{result}"))
-            else:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to generate inventory slips:\n{result}"))
-            
-            # Reset progress after a delay
-            self.root.after(2000, lambda: self.progress_var.set(0))
+            self.root.after(0, self.finish_generate, success, result)
         
         threading.Thread(target=generate, daemon=True).start()
-        def auto_fetch_from_bamboo(self, url=None):
-            """Handle Bamboo API access with proper authentication or fallback to manual data import"""
+    
+    def finish_generate(self, success, result):
+        if success:
+            messagebox.showinfo("Success", f"Inventory slips saved to:\n{result}")
+        else:
+            messagebox.showerror("Error", f"Failed to generate inventory slips:\n{result}")
+        
+        # Reset progress after a delay
+        self.root.after(2000, lambda: self.progress_var.set(0))
+    
+    def auto_fetch_from_bamboo(self, url=None):
+        """Handle Bamboo API access with proper authentication or fallback to manual data import"""
+        if not url:
+            url = self.url_entry.get().strip()
             if not url:
-                url = self.url_entry.get().strip()
-                if not url:
-                    messagebox.showerror("Error", "Please enter a Bamboo API URL.")
-                    return
-            
-            self.status_var.set("Connecting to Bamboo API...")
-            self.progress_var.set(10)
-            
-            # Setup headers for Bamboo API
-            headers = {
-                "User-Agent": "InventorySlipGenerator/2.0.0",
-                "Accept": "application/json",
-                "Content-Type": "application/json"
-            }
-            
-            # Check if we have API key in config
-            if 'API' not in self.config:
-                self.config['API'] = {}
-            
-            api_key = self.config['API'].get('bamboo_key', '')
-            if api_key:
-                headers["Authorization"] = f"Bearer {api_key}"
-            
-            def fetch_data():
-                try:
-                    req = urllib.request.Request(url, headers=headers)
-                    with urllib.request.urlopen(req) as resp:
-                        data = json.loads(resp.read().decode())
-                        
-                        # Process the data
-                        self.root.after(0, lambda: self.process_json_data(data))
-                        
-                        # Cache the response for offline use
-                        cache_dir = os.path.join(os.path.expanduser("~"), ".inventory_slip_cache")
-                        if not os.path.exists(cache_dir):
-                            os.makedirs(cache_dir)
-                        
-                        cache_file = os.path.join(cache_dir, "bamboo_latest.json")
-                        with open(cache_file, 'w') as f:
-                            json.dump(data, f)
-                        
-                        # Add to recent URLs
-                        if url not in self.recent_urls:
-                            self.recent_urls.insert(0, url)
-                            self.recent_urls = self.recent_urls[:10]
-                            self.config['PATHS']['recent_urls'] = '|'.join(self.recent_urls)
-                            save_config(self.config)
-                            self.update_recent_menu()
-                
-                except urllib.error.HTTPError as e:
-                    if e.code == 403:
-                        # Handle "forbidden" error - try to use cached data
-                        self.root.after(0, lambda: self.handle_bamboo_forbidden())
-                    else:
-                        self.root.after(0, lambda: messagebox.showerror("Error", f"API Error: {e.code} - {e.reason}"))
-                        self.root.after(0, lambda: self.status_var.set(f"Failed to fetch data: {e.reason}"))
-                        self.root.after(0, lambda: self.progress_var.set(0))
-                
-                except Exception as e:
-                    self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to fetch data: {str(e)}"))
-                    self.root.after(0, lambda: self.status_var.set("Failed to fetch data."))
-                    self.root.after(0, lambda: self.progress_var.set(0))
-            
-            # Run in a separate thread
-            threading.Thread(target=fetch_data, daemon=True).start()
+                messagebox.showerror("Error", "Please enter a Bamboo API URL.")
+                return
+        
+        self.status_var.set("Connecting to Bamboo API...")
+        self.progress_var.set(10)
+        
+        # Setup headers for Bamboo API
+        headers = {
+            "User-Agent": "InventorySlipGenerator/2.0.0",
+            "Accept": "application/json",
+            "Content-Type": "application/json"
+        }
+        
+        # Check if we have API key in config
+        if 'API' not in self.config:
+            self.config['API'] = {}
+        
+        api_key = self.config['API'].get('bamboo_key', '')
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        
+        cache_dir = os.path.join(os.path.expanduser("~"), ".inventory_slip_cache")
+        
+        def fetch_data():
+            data = fetch_url(url, headers)
+            
+            # Cache the response bytes as received for offline use
+            os.makedirs(cache_dir, exist_ok=True)
+            _write_file(os.path.join(cache_dir, "bamboo_latest.json"), data)
+            return data
+        
+        # The body is parsed once, by process_json_data on the worker
+        future = self.io_pool.submit(fetch_data)
+        future.add_done_callback(lambda f: self.root.after(0, self.finish_bamboo_fetch, url, f))
+    
+    def finish_bamboo_fetch(self, url, future):
+        error = future.exception()
+        if isinstance(error, urllib.error.HTTPError) and error.code == 403:
+            # Handle "forbidden" error - try to use cached data
+            self.handle_bamboo_forbidden()
+            return
+        self.finish_url_fetch(url, future)
 
     def handle_bamboo_forbidden(self):
         """Handle case where Bamboo access is forbidden"""
@@ -2578,14 +2617,11 @@ class InventorySlipGenerator:
         if os.path.exists(cache_file):
             try:
                 # Use cached data instead
-                with open(cache_file, 'r') as f:
-                    data = json.load(f)
-                
-                # Update JSON text area with cached data
-                self.json_text.delete(1.0, tk.END)
-                self.json_text.insert(tk.END, json.dumps(data, indent=2))
+                with open(cache_file, 'rb') as f:
+                    data = f.read()
                 
-                # Process the cached data
+                # Parse and process the cached data on the worker; this also
+                # shows it in the JSON text area
                 self.process_json_data(data)
                 
                 # Notify user
@@ -2700,6 +2736,8 @@ class InventorySlipGenerator:
     def on_close(self):
         # Save settings before closing
         save_config(self.config)
+        self.io_pool.shutdown(wait=False)
+        self.pool.shutdown(wait=False)
         self.root.destroy()
 
 
@@ -2732,4 +2770,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Needed for the page render worker processes in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
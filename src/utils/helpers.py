@@ -12,9 +12,9 @@ def chunk_records(records, chunk_size=4):
     for i in range(0, len(records), chunk_size):
         yield records[i:i + chunk_size]
 
-def adjust_table_font_sizes(doc_path):
+def apply_table_font_sizes(doc):
     """
-    Post-process a DOCX file to dynamically adjust font size inside table cells based on thresholds.
+    Adjust font size inside table cells of an in-memory Document based on thresholds.
     """
     thresholds = [
         (30, 12),   # <=30 chars → 12pt
@@ -29,8 +29,6 @@ def adjust_table_font_sizes(doc_path):
                 return size
         return 7  # Fallback
 
-    doc = Document(doc_path)
-
     for table in doc.tables:
         for row in table.rows:
             for cell in row.cells:
@@ -48,6 +46,12 @@ def adjust_table_font_sizes(doc_path):
                     for run in paragraph.runs:
                         run.font.size = Pt(font_size)
 
+def adjust_table_font_sizes(doc_path):
+    """
+    Post-process a DOCX file to dynamically adjust font size inside table cells based on thresholds.
+    """
+    doc = Document(doc_path)
+    apply_table_font_sizes(doc)
     doc.save(doc_path)
 
 def open_file(path):
@@ -185,15 +189,16 @@ def run_full_process_inventory_slips(selected_df, config, status_callback=None,
         outname = f"{now}_inventory_slips.docx"
         outpath = os.path.join(output_dir, outname)
         
+        # Adjust font sizes before the only save instead of reopening the file
         if status_callback:
-            status_callback("Saving document...")
+            status_callback("Adjusting formatting...")
         
-        master.save(outpath)
+        apply_table_font_sizes(master)
         
         if status_callback:
-            status_callback("Adjusting formatting...")
+            status_callback("Saving document...")
         
-        adjust_table_font_sizes(outpath)
+        master.save(outpath)
         
         if progress_callback:
             progress_callback(100)  # Complete progress